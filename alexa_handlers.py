@@ -4,143 +4,146 @@ Alexa skill handlers using ask-sdk-python (modern Alexa SDK).
 This module contains all Alexa intent handlers, replacing the deprecated Flask-Ask framework.
 """
 import re
-import datetime
-from typing import Optional, Dict, Any
+import functools
+from typing import Optional, Dict, Any, Tuple
 
 from ask_sdk_core.skill_builder import SkillBuilder
 from ask_sdk_core.dispatch_components import AbstractRequestHandler, AbstractExceptionHandler
 from ask_sdk_core.handler_input import HandlerInput
+from ask_sdk_core.utils import is_request_type, is_intent_name
 from ask_sdk_model import Response
 from ask_sdk_model.ui import SimpleCard
 
 from logger import logger, log_request, log_error
 import overseerr
 from overseerr import OverseerrError, OverseerrConnectionError, OverseerrAuthError
-from db import db_session, SessionState
-import json
-from voice_assistant_adapter import router, VoiceRequest, VoiceAssistantPlatform
-from unified_voice_handler import unified_handler
+from voice_assistant_adapter import router, VoiceRequest, VoiceResponse, VoiceAssistantPlatform
+from unified_voice_handler import unified_handler, save_state, load_state
 
 
 # ==========================================
-# JSON Encoder for Date Objects
+# Precompiled Patterns, Templates and Responses
 # ==========================================
 
-class DateTimeEncoder(json.JSONEncoder):
-    """Custom JSON encoder to handle date and datetime objects"""
-    def default(self, obj):
-        if isinstance(obj, (datetime.date, datetime.datetime)):
-            return obj.isoformat()
-        return super().default(obj)
+# Matched as substrings so plurals like "movies" or "shows" still count
+# TV keywords take priority over movie keywords wherever they appear
+_MEDIA_TYPE_RE = re.compile(r"tv|show|series|movie|film", re.IGNORECASE)
+_MEDIA_TYPES = {'tv': (0, 'tv'), 'show': (0, 'tv'), 'series': (0, 'tv'), 'movie': (1, 'movie'), 'film': (1, 'movie')}
+
+# Speech templates for search results
+_FOUND_TMPL_YEAR = "%s the %s %s, released in %s. Is that the one you want?"
+_FOUND_TMPL_NOYEAR = "%s the %s %s. Is that the one you want?"
+_NEXT_TMPL_YEAR = "What about the %s %s, released in %s?"
+_NEXT_TMPL_NOYEAR = "What about the %s %s?"
+
+# Fixed responses; their cards never change, so build them once
+_LAUNCH_SPEECH = (
+    "Welcome to Overtalkerr! You can say things like, "
+    "download the movie Jurassic World, or download the upcoming TV show Robin Hood. "
+    "What would you like to download?"
+)
+_HELP_SPEECH = (
+    "You can say things like: download the movie Jurassic World from 2015, "
+    "or download the upcoming TV show Robin Hood. "
+    "You can also specify seasons for TV shows, like download season 2 of Breaking Bad. "
+    "What would you like to download?"
+)
+_FALLBACK_SPEECH = (
+    "Sorry, I didn't understand that. You can say things like, "
+    "download the movie Jurassic World from 2015. What would you like to download?"
+)
+_GOODBYE_SPEECH = "Goodbye!"
+_ERROR_SPEECH = "Sorry, I encountered an unexpected error. Please try again."
+
+_CARD_TITLE = "Overtalkerr"
+_LAUNCH_CARD = SimpleCard(_CARD_TITLE, _LAUNCH_SPEECH)
+_HELP_CARD = SimpleCard("Overtalkerr Help", _HELP_SPEECH)
 
 
 # ==========================================
 # Helper Functions
 # ==========================================
 
+def _cache_session_ids(handler_input: HandlerInput) -> Dict[str, Any]:
+    """Stash user/session IDs in the per-request attributes so they are read once"""
+    ra = handler_input.attributes_manager.request_attributes
+    if 'uid' not in ra:
+        session = handler_input.request_envelope.session
+        ra['uid'] = session.user.user_id
+        ra['sid'] = session.session_id
+    return ra
+
+
 def get_user_id(handler_input: HandlerInput) -> str:
     """Extract user ID from Alexa request"""
-    return handler_input.request_envelope.session.user.user_id
+    return _cache_session_ids(handler_input)['uid']
 
 
 def get_session_id(handler_input: HandlerInput) -> str:
     """Extract session ID from Alexa request"""
-    return handler_input.request_envelope.session.session_id
+    return _cache_session_ids(handler_input)['sid']
+
+
+_DOWNLOAD_SLOTS = ('MediaTitle', 'Year', 'MediaType', 'Upcoming', 'Season')
 
 
-def get_slot_value(handler_input: HandlerInput, slot_name: str) -> Optional[str]:
-    """Safely extract slot value from request"""
-    slots = handler_input.request_envelope.request.intent.slots
-    if slot_name in slots and slots[slot_name].value:
-        return slots[slot_name].value
-    return None
+def get_slot_values(handler_input: HandlerInput, slot_names: Tuple[str, ...]) -> Dict[str, Optional[str]]:
+    """Safely extract several slot values from the request (missing/empty -> None)"""
+    slots = handler_input.request_envelope.request.intent.slots or {}
+    values = {}
+    for name in slot_names:
+        slot = slots.get(name)
+        values[name] = (slot.value or None) if slot else None
+    return values
 
 
 def media_type_from_text(text: Optional[str]) -> Optional[str]:
     """Extract media type from spoken text"""
     if not text:
         return None
-    t = text.lower()
-    if 'tv' in t or 'show' in t or 'series' in t:
-        return 'tv'
-    if 'movie' in t or 'film' in t:
-        return 'movie'
-    return None
+    found = _MEDIA_TYPE_RE.findall(text)
+    if not found:
+        return None
+    return min(_MEDIA_TYPES[k.lower()] for k in found)[1]
 
 
 def build_speech_for_item(item: Dict[str, Any], prefix: str = "I found") -> str:
     """Generate speech for a search result item"""
     title = item.get('_title') or item.get('title') or item.get('name') or 'Unknown title'
-    mtype = item.get('_mediaType') or 'title'
-    year = None
-    if item.get('_releaseDate'):
-        year = item['_releaseDate'][:4]
-
-    type_word = 'movie' if mtype == 'movie' else 'TV show'
+    rd = item.get('_releaseDate')
+    type_word = 'movie' if item.get('_mediaType') == 'movie' else 'TV show'
 
-    if year:
-        return f"{prefix} the {type_word} {title}, released in {year}. Is that the one you want?"
-    else:
-        return f"{prefix} the {type_word} {title}. Is that the one you want?"
+    if rd:
+        return _FOUND_TMPL_YEAR % (prefix, type_word, title, rd[:4])
+    return _FOUND_TMPL_NOYEAR % (prefix, type_word, title)
 
 
 def build_speech_for_next(item: Dict[str, Any]) -> str:
     """Generate speech for the next alternative result"""
     title = item.get('_title') or 'Unknown title'
-    mtype = item.get('_mediaType') or 'title'
-    year = None
-    if item.get('_releaseDate'):
-        year = item['_releaseDate'][:4]
-
-    type_word = 'movie' if mtype == 'movie' else 'TV show'
-
-    if year:
-        return f"What about the {type_word} {title}, released in {year}?"
-    else:
-        return f"What about the {type_word} {title}?"
-
-
-def save_state(user_id: str, conversation_id: str, state: Dict[str, Any]):
-    """Save conversation state to database"""
-    with db_session() as s:
-        existing = (
-            s.query(SessionState)
-            .filter(
-                SessionState.user_id == user_id,
-                SessionState.conversation_id == conversation_id
-            )
-            .one_or_none()
-        )
-        payload = json.dumps(state, cls=DateTimeEncoder)
-        if existing:
-            existing.state_json = payload
-        else:
-            row = SessionState(
-                user_id=user_id,
-                conversation_id=conversation_id,
-                state_json=payload
-            )
-            s.add(row)
-
-
-def load_state(user_id: str, conversation_id: str) -> Optional[Dict[str, Any]]:
-    """Load conversation state from database"""
-    with db_session() as s:
-        row = (
-            s.query(SessionState)
-            .filter(
-                SessionState.user_id == user_id,
-                SessionState.conversation_id == conversation_id
-            )
-            .one_or_none()
-        )
-        if row:
-            try:
-                return json.loads(row.state_json)
-            except Exception as e:
-                log_error("Failed to parse session state", e, user_id=user_id)
-                return None
-        return None
+    rd = item.get('_releaseDate')
+    type_word = 'movie' if item.get('_mediaType') == 'movie' else 'TV show'
+
+    if rd:
+        return _NEXT_TMPL_YEAR % (type_word, title, rd[:4])
+    return _NEXT_TMPL_NOYEAR % (type_word, title)
+
+
+def build_alexa_response(handler_input: HandlerInput, voice_response: VoiceResponse) -> Response:
+    """Translate a platform-agnostic VoiceResponse into an Alexa response"""
+    rb = handler_input.response_builder
+    rb.speak(voice_response.speech)
+
+    if voice_response.reprompt:
+        rb.ask(voice_response.reprompt)
+
+    if voice_response.card_text:
+        rb.set_card(SimpleCard(_CARD_TITLE, voice_response.card_text))
+
+    if voice_response.should_end_session:
+        rb.set_should_end_session(True)
+
+    return rb.response
 
 
 # ==========================================
@@ -150,25 +153,20 @@ def load_state(user_id: str, conversation_id: str) -> Optional[Dict[str, Any]]:
 class LaunchRequestHandler(AbstractRequestHandler):
     """Handler for skill launch"""
 
+    _MATCH = staticmethod(is_request_type("LaunchRequest"))
+
     def can_handle(self, handler_input: HandlerInput) -> bool:
-        from ask_sdk_core.utils import is_request_type
-        return is_request_type("LaunchRequest")(handler_input)
+        return self._MATCH(handler_input)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         user_id = get_user_id(handler_input)
         log_request("LaunchRequest", user_id)
 
-        speech = (
-            "Welcome to Overtalkerr! You can say things like, "
-            "download the movie Jurassic World, or download the upcoming TV show Robin Hood. "
-            "What would you like to download?"
-        )
-
         return (
             handler_input.response_builder
-            .speak(speech)
-            .ask(speech)
-            .set_card(SimpleCard("Overtalkerr", speech))
+            .speak(_LAUNCH_SPEECH)
+            .ask(_LAUNCH_SPEECH)
+            .set_card(_LAUNCH_CARD)
             .response
         )
 
@@ -176,63 +174,38 @@ class LaunchRequestHandler(AbstractRequestHandler):
 class DownloadIntentHandler(AbstractRequestHandler):
     """Handler for media download requests"""
 
+    _MATCH = staticmethod(is_intent_name("DownloadIntent"))
+
     def can_handle(self, handler_input: HandlerInput) -> bool:
-        from ask_sdk_core.utils import is_intent_name
-        return is_intent_name("DownloadIntent")(handler_input)
+        return self._MATCH(handler_input)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         user_id = get_user_id(handler_input)
         session_id = get_session_id(handler_input)
 
-        # Extract slots
-        media_title = get_slot_value(handler_input, "MediaTitle")
-        year = get_slot_value(handler_input, "Year")
-        media_type_text = get_slot_value(handler_input, "MediaType")
-        upcoming_text = get_slot_value(handler_input, "Upcoming")
-        season_text = get_slot_value(handler_input, "Season")
-
         # Build VoiceRequest using the adapter
         voice_request = VoiceRequest(
             platform=VoiceAssistantPlatform.ALEXA,
             user_id=user_id,
             session_id=session_id,
             intent_name="DownloadIntent",
-            slots={
-                'MediaTitle': media_title,
-                'Year': year,
-                'MediaType': media_type_text,
-                'Upcoming': upcoming_text,
-                'Season': season_text
-            },
+            slots=get_slot_values(handler_input, _DOWNLOAD_SLOTS),
             raw_request={}
         )
 
         # Use unified handler for consistent behavior across platforms
         voice_response = unified_handler.handle_download(voice_request)
 
-        # Build Alexa response
-        response_builder = handler_input.response_builder.speak(voice_response.speech)
-
-        if voice_response.reprompt:
-            response_builder = response_builder.ask(voice_response.reprompt)
-
-        if voice_response.card_text:
-            response_builder = response_builder.set_card(
-                SimpleCard("Overtalkerr", voice_response.card_text)
-            )
-
-        if voice_response.should_end_session:
-            response_builder = response_builder.set_should_end_session(True)
-
-        return response_builder.response
+        return build_alexa_response(handler_input, voice_response)
 
 
 class YesIntentHandler(AbstractRequestHandler):
     """Handler for AMAZON.YesIntent - confirms selection"""
 
+    _MATCH = staticmethod(is_intent_name("AMAZON.YesIntent"))
+
     def can_handle(self, handler_input: HandlerInput) -> bool:
-        from ask_sdk_core.utils import is_intent_name
-        return is_intent_name("AMAZON.YesIntent")(handler_input)
+        return self._MATCH(handler_input)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         user_id = get_user_id(handler_input)
@@ -251,29 +224,16 @@ class YesIntentHandler(AbstractRequestHandler):
         # Use unified handler
         voice_response = unified_handler.handle_yes(voice_request)
 
-        # Build Alexa response
-        response_builder = handler_input.response_builder.speak(voice_response.speech)
-
-        if voice_response.reprompt:
-            response_builder = response_builder.ask(voice_response.reprompt)
-
-        if voice_response.card_text:
-            response_builder = response_builder.set_card(
-                SimpleCard("Overtalkerr", voice_response.card_text)
-            )
-
-        if voice_response.should_end_session:
-            response_builder = response_builder.set_should_end_session(True)
-
-        return response_builder.response
+        return build_alexa_response(handler_input, voice_response)
 
 
 class NoIntentHandler(AbstractRequestHandler):
     """Handler for AMAZON.NoIntent - shows next result"""
 
+    _MATCH = staticmethod(is_intent_name("AMAZON.NoIntent"))
+
     def can_handle(self, handler_input: HandlerInput) -> bool:
-        from ask_sdk_core.utils import is_intent_name
-        return is_intent_name("AMAZON.NoIntent")(handler_input)
+        return self._MATCH(handler_input)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         user_id = get_user_id(handler_input)
@@ -292,43 +252,23 @@ class NoIntentHandler(AbstractRequestHandler):
         # Use unified handler
         voice_response = unified_handler.handle_no(voice_request)
 
-        # Build Alexa response
-        response_builder = handler_input.response_builder.speak(voice_response.speech)
-
-        if voice_response.reprompt:
-            response_builder = response_builder.ask(voice_response.reprompt)
-
-        if voice_response.card_text:
-            response_builder = response_builder.set_card(
-                SimpleCard("Overtalkerr", voice_response.card_text)
-            )
-
-        if voice_response.should_end_session:
-            response_builder = response_builder.set_should_end_session(True)
-
-        return response_builder.response
+        return build_alexa_response(handler_input, voice_response)
 
 
 class HelpIntentHandler(AbstractRequestHandler):
     """Handler for AMAZON.HelpIntent"""
 
+    _MATCH = staticmethod(is_intent_name("AMAZON.HelpIntent"))
+
     def can_handle(self, handler_input: HandlerInput) -> bool:
-        from ask_sdk_core.utils import is_intent_name
-        return is_intent_name("AMAZON.HelpIntent")(handler_input)
+        return self._MATCH(handler_input)
 
     def handle(self, handler_input: HandlerInput) -> Response:
-        speech = (
-            "You can say things like: download the movie Jurassic World from 2015, "
-            "or download the upcoming TV show Robin Hood. "
-            "You can also specify seasons for TV shows, like download season 2 of Breaking Bad. "
-            "What would you like to download?"
-        )
-
         return (
             handler_input.response_builder
-            .speak(speech)
-            .ask(speech)
-            .set_card(SimpleCard("Overtalkerr Help", speech))
+            .speak(_HELP_SPEECH)
+            .ask(_HELP_SPEECH)
+            .set_card(_HELP_CARD)
             .response
         )
 
@@ -336,19 +276,16 @@ class HelpIntentHandler(AbstractRequestHandler):
 class CancelAndStopIntentHandler(AbstractRequestHandler):
     """Handler for AMAZON.CancelIntent and AMAZON.StopIntent"""
 
+    _MATCH_CANCEL = staticmethod(is_intent_name("AMAZON.CancelIntent"))
+    _MATCH_STOP = staticmethod(is_intent_name("AMAZON.StopIntent"))
+
     def can_handle(self, handler_input: HandlerInput) -> bool:
-        from ask_sdk_core.utils import is_intent_name
-        return (
-            is_intent_name("AMAZON.CancelIntent")(handler_input) or
-            is_intent_name("AMAZON.StopIntent")(handler_input)
-        )
+        return self._MATCH_CANCEL(handler_input) or self._MATCH_STOP(handler_input)
 
     def handle(self, handler_input: HandlerInput) -> Response:
-        speech = "Goodbye!"
-
         return (
             handler_input.response_builder
-            .speak(speech)
+            .speak(_GOODBYE_SPEECH)
             .set_should_end_session(True)
             .response
         )
@@ -357,20 +294,16 @@ class CancelAndStopIntentHandler(AbstractRequestHandler):
 class FallbackIntentHandler(AbstractRequestHandler):
     """Handler for AMAZON.FallbackIntent"""
 
+    _MATCH = staticmethod(is_intent_name("AMAZON.FallbackIntent"))
+
     def can_handle(self, handler_input: HandlerInput) -> bool:
-        from ask_sdk_core.utils import is_intent_name
-        return is_intent_name("AMAZON.FallbackIntent")(handler_input)
+        return self._MATCH(handler_input)
 
     def handle(self, handler_input: HandlerInput) -> Response:
-        speech = (
-            "Sorry, I didn't understand that. You can say things like, "
-            "download the movie Jurassic World from 2015. What would you like to download?"
-        )
-
         return (
             handler_input.response_builder
-            .speak(speech)
-            .ask(speech)
+            .speak(_FALLBACK_SPEECH)
+            .ask(_FALLBACK_SPEECH)
             .response
         )
 
@@ -378,9 +311,10 @@ class FallbackIntentHandler(AbstractRequestHandler):
 class SessionEndedRequestHandler(AbstractRequestHandler):
     """Handler for session end"""
 
+    _MATCH = staticmethod(is_request_type("SessionEndedRequest"))
+
     def can_handle(self, handler_input: HandlerInput) -> bool:
-        from ask_sdk_core.utils import is_request_type
-        return is_request_type("SessionEndedRequest")(handler_input)
+        return self._MATCH(handler_input)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         # Cleanup if needed
@@ -388,6 +322,43 @@ class SessionEndedRequestHandler(AbstractRequestHandler):
         return handler_input.response_builder.response
 
 
+class RouterHandler(AbstractRequestHandler):
+    """
+    Single entry point that dispatches by request type / intent name.
+
+    Replaces a linear walk over every handler's can_handle with one dict
+    lookup. Unknown intents fall through to the fallback handler.
+    """
+
+    _REQUEST_TABLE = {
+        "LaunchRequest": LaunchRequestHandler().handle,
+        "SessionEndedRequest": SessionEndedRequestHandler().handle,
+    }
+
+    _INTENT_TABLE = {
+        "DownloadIntent": DownloadIntentHandler().handle,
+        "AMAZON.YesIntent": YesIntentHandler().handle,
+        "AMAZON.NoIntent": NoIntentHandler().handle,
+        "AMAZON.HelpIntent": HelpIntentHandler().handle,
+        "AMAZON.CancelIntent": CancelAndStopIntentHandler().handle,
+        "AMAZON.StopIntent": CancelAndStopIntentHandler().handle,
+        "AMAZON.FallbackIntent": FallbackIntentHandler().handle,
+    }
+
+    _fallback = staticmethod(_INTENT_TABLE["AMAZON.FallbackIntent"])
+
+    def can_handle(self, handler_input: HandlerInput) -> bool:
+        request_type = handler_input.request_envelope.request.object_type
+        return request_type == "IntentRequest" or request_type in self._REQUEST_TABLE
+
+    def handle(self, handler_input: HandlerInput) -> Response:
+        _cache_session_ids(handler_input)
+        request = handler_input.request_envelope.request
+        if request.object_type == "IntentRequest":
+            return self._INTENT_TABLE.get(request.intent.name, self._fallback)(handler_input)
+        return self._REQUEST_TABLE[request.object_type](handler_input)
+
+
 # ==========================================
 # Exception Handlers
 # ==========================================
@@ -401,12 +372,10 @@ class CatchAllExceptionHandler(AbstractExceptionHandler):
     def handle(self, handler_input: HandlerInput, exception: Exception) -> Response:
         log_error("Unhandled exception in Alexa handler", exception)
 
-        speech = "Sorry, I encountered an unexpected error. Please try again."
-
         return (
             handler_input.response_builder
-            .speak(speech)
-            .ask(speech)
+            .speak(_ERROR_SPEECH)
+            .ask(_ERROR_SPEECH)
             .response
         )
 
@@ -415,21 +384,26 @@ class CatchAllExceptionHandler(AbstractExceptionHandler):
 # Skill Builder
 # ==========================================
 
-# Create skill builder
-sb = SkillBuilder()
+# Handlers are stateless, so one instance of each is shared by every request.
+# RouterHandler owns the per-intent handlers and dispatches with a dict lookup.
+_HANDLERS = (
+    RouterHandler(),
+)
+
+_EXCEPTION_HANDLERS = (
+    CatchAllExceptionHandler(),
+)
+
 
-# Register request handlers
-sb.add_request_handler(LaunchRequestHandler())
-sb.add_request_handler(DownloadIntentHandler())
-sb.add_request_handler(YesIntentHandler())
-sb.add_request_handler(NoIntentHandler())
-sb.add_request_handler(HelpIntentHandler())
-sb.add_request_handler(CancelAndStopIntentHandler())
-sb.add_request_handler(FallbackIntentHandler())
-sb.add_request_handler(SessionEndedRequestHandler())
+@functools.cache
+def _build_skill():
+    """Register handlers and build the skill (once per process)"""
+    sb = SkillBuilder()
+    for handler in _HANDLERS:
+        sb.add_request_handler(handler)
+    for handler in _EXCEPTION_HANDLERS:
+        sb.add_exception_handler(handler)
+    return sb.create()
 
-# Register exception handler
-sb.add_exception_handler(CatchAllExceptionHandler())
 
-# Build the skill
-skill = sb.create()
+skill = _build_skill()
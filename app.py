@@ -15,35 +15,115 @@ This replaces the deprecated Flask-Ask framework with modern, production-ready c
 """
 import json
 import os
-import re
-import datetime as dt
 import base64
-from typing import Any, Dict, List, Optional
-
-from flask import Flask, request, jsonify, send_from_directory, Response
-from ask_sdk_core.skill_builder import SkillBuilder
-from ask_sdk_core.dispatch_components import AbstractRequestHandler, AbstractExceptionHandler
-from ask_sdk_core.utils import is_request_type, is_intent_name
-from ask_sdk_core.handler_input import HandlerInput
-from ask_sdk_core.serialize import DefaultSerializer
-from ask_sdk_model import Response as AlexaResponse
-from ask_sdk_model.ui import SimpleCard
+import functools
+import hashlib
+import hmac
+import ipaddress
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from flask import Flask, Blueprint, request, jsonify, Response
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import case, func, select
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
 
 from config import Config
-from logger import logger, log_request, log_error
+from logger import logger, log_error
 from db import db_session, SessionState, cleanup_old_sessions
 import overseerr
-from overseerr import OverseerrError, OverseerrConnectionError
-from voice_assistant_adapter import router, VoiceResponse, VoiceAssistantPlatform
-from unified_voice_handler import unified_handler, load_state, save_state
+from media_backends import get_backend, BackendFactory
+from voice_assistant_adapter import router, VoiceAssistantPlatform
+from unified_voice_handler import unified_handler, load_state, decode_state
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson for jsonify() and request.get_json().
+
+    Keeps Flask's defaults: sorted keys, HTTP-date datetimes (via default()),
+    and indented output in debug mode.
+    """
+
+    _OPTIONS = (orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = self._OPTIONS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """jsonify(): pass orjson's bytes straight to the response, no str round trip"""
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self._OPTIONS | orjson.OPT_APPEND_NEWLINE
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option),
+            mimetype=self.mimetype,
+        )
+
 
 # Initialize Flask app
 app = Flask(__name__)
 app.config['SECRET_KEY'] = Config.SECRET_KEY
+if orjson:
+    app.json = OrjsonProvider(app)
+
+# gzip JSON bodies (session state, config, stats) for clients that accept it;
+# small payloads like most voice replies aren't worth the CPU
+if Compress:
+    app.config['COMPRESS_MIMETYPES'] = ['application/json']
+    app.config['COMPRESS_ALGORITHM'] = 'gzip'
+    app.config['COMPRESS_LEVEL'] = 4
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    Compress(app)
 
 # Static directory for test UI
 STATIC_DIR = os.path.join(os.path.dirname(__file__), 'static')
 
+# Browser cache lifetime for the HTML UIs; ETag revalidation still applies after it
+UI_MAX_AGE = 3600
+
+
+@functools.lru_cache(maxsize=None)
+def _load_ui_page(filename: str) -> Tuple[bytes, str]:
+    """Read a UI page once per process and hash it for its ETag"""
+    with open(os.path.join(STATIC_DIR, filename), 'rb') as f:
+        body = f.read()
+    return body, hashlib.sha1(body).hexdigest()
+
+
+def send_ui_page(filename: str) -> Response:
+    """Serve a static UI page from memory with caching headers (conditional GET via ETag)"""
+    if app.debug:
+        # Pick up edits while developing
+        _load_ui_page.cache_clear()
+    body, etag = _load_ui_page(filename)
+    resp = Response(body, mimetype='text/html')
+    resp.set_etag(etag)
+    resp.cache_control.max_age = UI_MAX_AGE
+    # Private: the test UI may sit behind Basic Auth, so keep it out of shared caches
+    resp.cache_control.private = True
+    return resp.make_conditional(request)
+
 logger.info("Overtalkerr starting up...")
 
 # Check backend connectivity on startup
@@ -54,11 +134,18 @@ if not Config.MOCK_BACKEND:
 # ALEXA SKILL (ask-sdk-python)
 # ========================================
 
-# Import Alexa handlers from dedicated module
-from alexa_handlers import skill as alexa_skill
+@functools.cache
+def get_alexa_skill():
+    """
+    Build the Alexa skill and serializer on first use.
 
-# Initialize Alexa serializer for request/response handling
-alexa_serializer = DefaultSerializer()
+    The ask-sdk packages are only imported once an Alexa request arrives, so
+    workers serving the dashboard, config UI, or other platforms never pay for them.
+    """
+    from ask_sdk_core.serialize import DefaultSerializer
+    from alexa_handlers import skill
+
+    return skill, DefaultSerializer()
 
 # ========================================
 # DASHBOARD / LANDING PAGE
@@ -67,63 +154,127 @@ alexa_serializer = DefaultSerializer()
 @app.route('/')
 def dashboard():
     """Serve the main dashboard"""
-    return send_from_directory('static', 'dashboard.html')
+    return send_ui_page('dashboard.html')
+
+
+# Backend probes for /api/stats and /health run here so they overlap the DB work
+_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='probe')
+
+# The dashboard polls /api/stats; serve the last payload for _STATS_TTL seconds
+# so rapid polling (or several open dashboards) costs one DB pass per window
+_STATS_TTL = 10
+_stats_cache = {'ts': 0.0, 'payload': None}
+_stats_lock = threading.Lock()
+
+
+# (local date, that day's midnight as naive UTC), recomputed when the date changes
+_today_start = (None, None)
+
+
+def _today_start_utc() -> datetime:
+    """
+    Start of the server's local day as a naive UTC datetime.
+
+    updated_at is stored as naive UTC, so "today" has to be converted before
+    comparing or the count is skewed by the server's UTC offset.
+    """
+    global _today_start
+    local_now = datetime.now().astimezone()
+    day, start = _today_start
+    if day != local_now.date():
+        midnight = local_now.replace(hour=0, minute=0, second=0, microsecond=0)
+        start = midnight.astimezone(timezone.utc).replace(tzinfo=None)
+        _today_start = (local_now.date(), start)
+    return start
+
+
+def invalidate_stats_cache() -> None:
+    """Force the next /api/stats call to recompute (after deletes or config changes)"""
+    _stats_cache['ts'] = 0.0
 
 
 @app.route('/api/stats')
 def get_stats():
     """Get dashboard statistics"""
-    try:
-        from db import SessionState, db_session
-        from datetime import datetime, timedelta
-        from media_backends import get_backend, BackendFactory
+    if time.monotonic() - _stats_cache['ts'] < _STATS_TTL:
+        return jsonify(_stats_cache['payload'])
 
-        stats = {}
+    with _stats_lock:
+        # Another thread may have refreshed while we waited
+        if time.monotonic() - _stats_cache['ts'] < _STATS_TTL:
+            return jsonify(_stats_cache['payload'])
+        return _compute_stats()
 
-        # Backend status
-        # Check if backend is configured
-        if not Config.MEDIA_BACKEND_URL or Config.MEDIA_BACKEND_URL == 'http://your-backend-url:5055':
+
+def _backend_stats() -> Dict[str, Any]:
+    """Backend section of the dashboard stats (may probe the backend over HTTP)"""
+    stats = {}
+
+    # Check if backend is configured
+    if not Config.BACKEND_CONFIGURED:
+        stats['backend_connected'] = False
+        stats['backend_type'] = 'Not Configured'
+        stats['backend_configured'] = False
+    else:
+        stats['backend_configured'] = True
+
+        # Try to get backend info
+        try:
+            backend = get_backend()
+            stats['backend_type'] = backend.__class__.__name__.replace('Backend', '')
+            stats['backend_connected'] = True
+        except Exception as e:
+            # Couldn't initialize backend, but still show what we know
+            logger.warning(f"Could not initialize backend: {e}")
             stats['backend_connected'] = False
-            stats['backend_type'] = 'Not Configured'
-            stats['backend_configured'] = False
-        else:
-            stats['backend_configured'] = True
 
-            # Try to get backend info
+            # Try to guess backend type from URL or just show as configured
             try:
-                backend = get_backend()
-                stats['backend_type'] = backend.__class__.__name__.replace('Backend', '')
-                stats['backend_connected'] = True
-            except Exception as e:
-                # Couldn't initialize backend, but still show what we know
-                logger.warning(f"Could not initialize backend: {e}")
-                stats['backend_connected'] = False
-
-                # Try to guess backend type from URL or just show as configured
-                try:
-                    detected_type = BackendFactory.detect_backend_type(Config.MEDIA_BACKEND_URL, Config.MEDIA_BACKEND_API_KEY)
-                    stats['backend_type'] = detected_type.value.title()
-                except:
-                    # Can't detect, use generic name
-                    stats['backend_type'] = 'Backend'
+                detected_type = BackendFactory.detect_backend_type(Config.MEDIA_BACKEND_URL, Config.MEDIA_BACKEND_API_KEY)
+                stats['backend_type'] = detected_type.value.title()
+            except:
+                # Can't detect, use generic name
+                stats['backend_type'] = 'Backend'
+
+    return stats
+
+
+def _compute_stats():
+    """Build the dashboard statistics response and refresh the cache"""
+    try:
+        # Backend probe (HTTP when the backend isn't initialized) overlaps the DB queries
+        backend_future = _IO_POOL.submit(_backend_stats)
+        stats = {}
 
         # Database stats
+        today = _today_start_utc()
+        week_ago = datetime.utcnow() - timedelta(days=7)
         with db_session() as session:
-            # Total requests (approximate by unique media titles in session state)
-            total_count = session.query(SessionState).count()
-            stats['total_requests'] = total_count
-
-            # Recent activity (last 10)
-            recent = session.query(SessionState).order_by(
-                SessionState.updated_at.desc()
-            ).limit(10).all()
+            # Total / today / this week in one pass over the table
+            total_count, today_count, week_count = session.execute(
+                select(
+                    func.count(),
+                    func.coalesce(func.sum(case((SessionState.updated_at >= today, 1), else_=0)), 0),
+                    func.coalesce(func.sum(case((SessionState.updated_at >= week_ago, 1), else_=0)), 0),
+                ).select_from(SessionState)
+            ).one()
+            # int(): MySQL returns SUM() as Decimal
+            stats['total_requests'] = int(total_count)
+            stats['requests_today'] = int(today_count)
+            stats['requests_this_week'] = int(week_count)
+
+            # Recent activity (last 10); only the columns the feed needs
+            recent = session.execute(
+                select(SessionState.state_json, SessionState.updated_at)
+                .order_by(SessionState.updated_at.desc())
+                .limit(10)
+            ).all()
 
             stats['recent_activity'] = []
             for s in recent:
                 try:
                     # Parse the JSON from state_json column
-                    import json
-                    state_data = json.loads(s.state_json) if s.state_json else {}
+                    state_data = decode_state(s.state_json) if s.state_json else {}
 
                     # Try to get the result - could be in 'chosen_result' (old) or 'results' array (new)
                     result = None
@@ -150,6 +301,8 @@ def get_stats():
                                 year = str(result['_date']).split('-')[0]
                             except:
                                 pass
+                        elif result.get('_releaseDate'):
+                            year = result['_releaseDate'][:4]
 
                         # Extract media type
                         media_type = result.get('_mediaType') or result.get('mediaType') or result.get('type', 'unknown')
@@ -165,30 +318,16 @@ def get_stats():
                     logger.debug(f"Skipping session in activity feed: {e}")
                     continue
 
-            # Today's requests
-            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            today_count = session.query(SessionState).filter(
-                SessionState.updated_at >= today
-            ).count()
-            stats['requests_today'] = today_count
-
-            # This week's requests
-            week_ago = datetime.now() - timedelta(days=7)
-            week_count = session.query(SessionState).filter(
-                SessionState.updated_at >= week_ago
-            ).count()
-            stats['requests_this_week'] = week_count
+        stats.update(backend_future.result())
 
         # Configuration status
-        stats['config_complete'] = bool(
-            Config.MEDIA_BACKEND_URL and
-            Config.MEDIA_BACKEND_API_KEY and
-            Config.PUBLIC_BASE_URL
-        )
+        stats['config_complete'] = Config.CONFIG_COMPLETE
 
         stats['public_url'] = Config.PUBLIC_BASE_URL or 'Not configured'
         stats['backend_url'] = Config.MEDIA_BACKEND_URL or 'Not configured'
 
+        _stats_cache['payload'] = stats
+        _stats_cache['ts'] = time.monotonic()
         return jsonify(stats)
 
     except Exception as e:
@@ -196,54 +335,174 @@ def get_stats():
         return jsonify({"error": str(e)}), 500
 
 
+_VERSION_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'VERSION')
+# (mtime, contents) of the last VERSION read; re-read only when the file changes,
+# e.g. after /api/update pulls a new release
+_version_cache = (None, None)
+
+
+@functools.lru_cache(maxsize=16)
+def _version_key(version: str) -> Tuple[int, ...]:
+    """Comparable tuple for a semver string, ignoring -beta/-alpha suffixes"""
+    return tuple(int(x) for x in version.split('-')[0].split('.'))
+
+
+def _read_version() -> Optional[str]:
+    """Installed version from the VERSION file (None if unreadable)"""
+    global _version_cache
+    try:
+        mtime = os.stat(_VERSION_FILE).st_mtime_ns
+        if mtime != _version_cache[0]:
+            with open(_VERSION_FILE, 'r') as f:
+                _version_cache = (mtime, f.read().strip())
+        return _version_cache[1]
+    except OSError as e:
+        logger.warning(f"Could not read VERSION file: {e}")
+        return None
+
+
+# Latest GitHub release. /api/version answers from this cache and schedules a
+# revalidation on _IO_POOL once it goes stale, so it never waits on GitHub.
+# Revalidated with If-None-Match so unchanged releases cost a 304 (and no
+# rate-limit token). Persisted next to VERSION so a restart doesn't start
+# cold; fetched_at is wall-clock for that reason.
+_GITHUB_RELEASE_URL = 'https://api.github.com/repos/mscodemonkey/overtalkerr/releases/latest'
+_RELEASE_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'VERSION.cache.json')
+_RELEASE_FRESH_FOR = 600
+# After a failed check, retry this soon rather than on every poll
+_RELEASE_RETRY_AFTER = 60
+_release_cache = {'etag': None, 'release': None, 'fetched_at': 0.0}
+_release_lock = threading.Lock()
+# Last refresh failure, reported by /api/version (not persisted)
+_release_error: Optional[str] = None
+# In-flight revalidation, so concurrent requests share one GitHub call
+_release_refresh: Optional[Future] = None
+_release_refresh_lock = threading.Lock()
+
+
+def _load_release_cache() -> None:
+    """Seed the release cache from disk (best effort)"""
+    try:
+        with open(_RELEASE_CACHE_FILE, 'rb') as f:
+            _release_cache.update(json.loads(f.read()))
+    except (OSError, ValueError):
+        pass
+
+
+def _save_release_cache() -> None:
+    """Persist the release cache to disk (best effort; may be read-only)"""
+    try:
+        with open(_RELEASE_CACHE_FILE, 'w') as f:
+            json.dump(_release_cache, f)
+    except OSError as e:
+        logger.debug(f"Could not persist release cache: {e}")
+
+
+def _latest_release() -> Optional[dict]:
+    """
+    Latest release fields (tag_name, html_url, body, published_at), or None.
+
+    Serves the cached copy while fresh, otherwise revalidates with GitHub;
+    a failed revalidation returns the last known release and backs off for
+    _RELEASE_RETRY_AFTER seconds. Raises on network errors.
+    """
+    with _release_lock:
+        if time.time() - _release_cache['fetched_at'] < _RELEASE_FRESH_FOR:
+            return _release_cache['release']
+
+        headers = {'Accept': 'application/vnd.github.v3+json'}
+        if _release_cache['etag'] and _release_cache['release']:
+            headers['If-None-Match'] = _release_cache['etag']
+
+        try:
+            gh_response = requests.get(_GITHUB_RELEASE_URL, headers=headers, timeout=5)
+
+            if gh_response.status_code == 304:
+                _release_cache['fetched_at'] = time.time()
+            elif gh_response.status_code == 200:
+                release_data = gh_response.json()
+                _release_cache['release'] = {
+                    key: release_data.get(key)
+                    for key in ('tag_name', 'html_url', 'body', 'published_at')
+                }
+                _release_cache['etag'] = gh_response.headers.get('ETag')
+                _release_cache['fetched_at'] = time.time()
+            else:
+                # Rate limited or GitHub trouble: fall back to whatever we had
+                logger.warning(f"GitHub release check returned HTTP {gh_response.status_code}")
+                _release_cache['fetched_at'] = time.time() - _RELEASE_FRESH_FOR + _RELEASE_RETRY_AFTER
+        except Exception:
+            _release_cache['fetched_at'] = time.time() - _RELEASE_FRESH_FOR + _RELEASE_RETRY_AFTER
+            _save_release_cache()
+            raise
+
+        _save_release_cache()
+        return _release_cache['release']
+
+
+def _refresh_release() -> None:
+    """Revalidate the latest release, recording any failure for /api/version"""
+    global _release_error
+    try:
+        _latest_release()
+        _release_error = None
+    except Exception as e:
+        logger.warning(f"Could not check for updates: {e}")
+        _release_error = str(e)
+
+
+def _schedule_release_refresh() -> Future:
+    """Revalidate in the background unless a revalidation is already running"""
+    global _release_refresh
+    with _release_refresh_lock:
+        if _release_refresh is None or _release_refresh.done():
+            _release_refresh = _IO_POOL.submit(_refresh_release)
+        return _release_refresh
+
+
+_load_release_cache()
+
+
 @app.route('/api/version')
 def get_version():
-    """Get current version and check for updates from GitHub"""
-    import os
-    import requests
-    from datetime import datetime, timedelta
-
+    """Get current version and the latest GitHub release (cached, revalidated with ETags)"""
     try:
-        # Read current version
-        version_file = os.path.join(os.path.dirname(__file__), 'VERSION')
-        with open(version_file, 'r') as f:
-            current_version = f.read().strip()
+        current_version = _read_version()
+        if current_version is None:
+            raise OSError("VERSION file could not be read")
 
+        # Stale cache: answer from it (latest_version None until the first
+        # check lands) and revalidate in the background
+        if time.time() - _release_cache['fetched_at'] >= _RELEASE_FRESH_FOR:
+            _schedule_release_refresh()
+
+        fetched_at = _release_cache['fetched_at']
         response_data = {
             'current_version': current_version,
             'update_available': False,
             'latest_version': None,
             'release_url': None,
             'release_notes': None,
-            'checked_at': datetime.utcnow().isoformat()
+            'checked_at': (datetime.fromtimestamp(fetched_at, timezone.utc) if fetched_at else datetime.now(timezone.utc)).isoformat()
         }
+        if _release_error:
+            response_data['check_error'] = _release_error
 
-        # Check GitHub for latest release
+        # Compare against the cached latest release
         try:
-            github_api = 'https://api.github.com/repos/mscodemonkey/overtalkerr/releases/latest'
-            headers = {'Accept': 'application/vnd.github.v3+json'}
-
-            gh_response = requests.get(github_api, headers=headers, timeout=5)
+            release_data = _release_cache['release']
 
-            if gh_response.status_code == 200:
-                release_data = gh_response.json()
-                latest_version = release_data.get('tag_name', '').lstrip('v')
+            if release_data:
+                latest_version = (release_data.get('tag_name') or '').lstrip('v')
 
                 response_data['latest_version'] = latest_version
                 response_data['release_url'] = release_data.get('html_url')
-                response_data['release_notes'] = release_data.get('body', '')
+                response_data['release_notes'] = release_data.get('body') or ''
                 response_data['published_at'] = release_data.get('published_at')
 
                 # Simple version comparison (works for semver like 1.0.0)
                 if latest_version and latest_version != current_version:
-                    # Remove -beta, -alpha suffixes for comparison
-                    current_clean = current_version.split('-')[0]
-                    latest_clean = latest_version.split('-')[0]
-
-                    current_parts = [int(x) for x in current_clean.split('.')]
-                    latest_parts = [int(x) for x in latest_clean.split('.')]
-
-                    if latest_parts > current_parts:
+                    if _version_key(latest_version) > _version_key(current_version):
                         response_data['update_available'] = True
                         logger.info(f"Update available: {current_version} -> {latest_version}")
 
@@ -397,6 +656,10 @@ def perform_update():
 # ALEXA ENDPOINT
 # ========================================
 
+# Empty reply for SessionEndedRequest (no speech allowed)
+_SESSION_ENDED_RESPONSE = {"version": "1.0", "response": {}}
+
+
 @app.route('/alexa', methods=['POST'])
 def alexa_webhook():
     """
@@ -405,17 +668,25 @@ def alexa_webhook():
     This endpoint handles all Alexa skill requests with proper verification.
     """
     try:
-        # Get raw request data
-        request_data = request.get_json()
+        alexa_skill, alexa_serializer = get_alexa_skill()
 
-        logger.debug("Received Alexa request", extra={"request_type": request_data.get('request', {}).get('type')})
-
-        # Deserialize the JSON dict into a proper RequestEnvelope object
+        # Deserialize the raw body straight into a RequestEnvelope; the
+        # serializer parses it itself, so decoding it here first and
+        # re-encoding would be wasted work
         request_envelope = alexa_serializer.deserialize(
-            payload=json.dumps(request_data),
+            payload=request.get_data(cache=False, as_text=True),
             obj_type='ask_sdk_model.request_envelope.RequestEnvelope'
         )
 
+        request_type = getattr(request_envelope.request, 'object_type', None)
+        logger.debug("Received Alexa request", extra={"request_type": request_type})
+
+        # Alexa ignores any reply to SessionEndedRequest; skip skill dispatch
+        # and envelope serialization entirely
+        if request_type == 'SessionEndedRequest':
+            logger.info("Session ended")
+            return jsonify(_SESSION_ENDED_RESPONSE)
+
         # Process with ask-sdk-python skill
         response_envelope = alexa_skill.invoke(request_envelope=request_envelope, context=None)
 
@@ -562,29 +833,39 @@ def home_assistant_webhook():
 # TEST HARNESS (Web UI)
 # ========================================
 
+# All /test routes live on one blueprint so the auth hook only runs for them
+test_bp = Blueprint('test', __name__, url_prefix='/test')
+
+# The harness always speaks the Siri Shortcuts format, so skip platform detection
+_TEST_ADAPTER = router.adapter_for(VoiceAssistantPlatform.SIRI)
+
+# Loopback and RFC 1918 private ranges that skip test-endpoint auth
+_LOCAL_NETS = tuple(ipaddress.ip_network(n) for n in (
+    '127.0.0.0/8',
+    '::1/128',
+    '10.0.0.0/8',
+    '172.16.0.0/12',
+    '192.168.0.0/16',
+))
+
+
+@functools.lru_cache(maxsize=1024)
 def _is_local_ip(ip: str) -> bool:
-    """Check if IP is from local network"""
+    """Check if IP is from local network (memoized; clients repeat)"""
     if not ip:
         return False
-    return (
-        ip.startswith('127.') or
-        ip == '::1' or
-        ip.startswith('192.168.') or
-        ip.startswith('10.') or
-        ip.startswith('172.16.') or
-        ip.startswith('172.17.') or
-        ip.startswith('172.18.') or
-        ip.startswith('172.19.') or
-        ip.startswith('172.2')
-    )
+    try:
+        addr = ipaddress.ip_address(ip)
+    except ValueError:
+        return False
+    # Dual-stack sockets report IPv4 clients as ::ffff:a.b.c.d
+    if addr.version == 6 and addr.ipv4_mapped:
+        addr = addr.ipv4_mapped
+    return any(addr in net for net in _LOCAL_NETS)
 
 
 def _needs_auth() -> bool:
-    """Check if request needs authentication"""
-    path = request.path or ''
-    if not path.startswith('/test'):
-        return False
-
+    """Check if a test harness request needs authentication"""
     # Get client IP
     xff = request.headers.get('X-Forwarded-For', '')
     ip = (xff.split(',')[0].strip() if xff else request.remote_addr) or ''
@@ -596,25 +877,38 @@ def _needs_auth() -> bool:
     return bool(Config.BASIC_AUTH_USER and Config.BASIC_AUTH_PASS)
 
 
+# Precomputed header for the configured test credentials, so the common case
+# is one constant-time comparison with no base64 decoding
+_EXPECTED_BASIC_AUTH = (
+    b"Basic " + base64.b64encode(f"{Config.BASIC_AUTH_USER}:{Config.BASIC_AUTH_PASS}".encode('utf-8'))
+    if Config.BASIC_AUTH_USER and Config.BASIC_AUTH_PASS else None
+)
+
+
 def _check_basic_auth() -> Optional[Response]:
     """Verify Basic Auth credentials"""
     auth = request.headers.get('Authorization', '')
     if not auth.startswith('Basic '):
         return Response('Authentication required', 401, {'WWW-Authenticate': 'Basic realm="Test"'})
 
+    if _EXPECTED_BASIC_AUTH and hmac.compare_digest(auth.encode('utf-8'), _EXPECTED_BASIC_AUTH):
+        return None
+
+    # Slow path: the header may still match after decoding (e.g. different padding)
     try:
         raw = base64.b64decode(auth.split(' ', 1)[1]).decode('utf-8')
         user, pwd = raw.split(':', 1)
     except Exception:
         return Response('Invalid auth header', 401, {'WWW-Authenticate': 'Basic realm="Test"'})
 
-    if user == Config.BASIC_AUTH_USER and pwd == Config.BASIC_AUTH_PASS:
+    user_ok = hmac.compare_digest(user.encode('utf-8'), (Config.BASIC_AUTH_USER or '').encode('utf-8'))
+    pass_ok = hmac.compare_digest(pwd.encode('utf-8'), (Config.BASIC_AUTH_PASS or '').encode('utf-8'))
+    if user_ok and pass_ok:
         return None
 
     return Response('Unauthorized', 401, {'WWW-Authenticate': 'Basic realm="Test"'})
 
 
-@app.before_request
 def protect_test_endpoints():
     """Protect test endpoints with Basic Auth if configured"""
     if _needs_auth():
@@ -623,13 +917,13 @@ def protect_test_endpoints():
             return failure
 
 
-@app.route('/test', methods=['GET'])
+@test_bp.route('', methods=['GET'])
 def test_ui():
     """Serve test harness UI"""
-    return send_from_directory(STATIC_DIR, 'test_ui.html')
+    return send_ui_page('test_ui.html')
 
 
-@app.route('/test/info', methods=['GET'])
+@test_bp.route('/info', methods=['GET'])
 def test_info():
     """Get environment info for test UI"""
     return jsonify({
@@ -640,12 +934,12 @@ def test_info():
     })
 
 
-@app.route('/test/start', methods=['POST'])
+@test_bp.route('/start', methods=['POST'])
 def test_start():
     """Start a new search (test harness)"""
     data = request.get_json(silent=True) or {}
     user_id = data.get('userId', 'test-user')
-    conv_id = data.get('conversationId') or f"test-{int(dt.datetime.utcnow().timestamp())}"
+    conv_id = data.get('conversationId') or f"test-{int(time.time())}"
     title = data.get('title', '')
     year = data.get('year')
     media_type_text = data.get('mediaType')
@@ -656,7 +950,7 @@ def test_start():
         return jsonify({"error": "title is required"}), 400
 
     # Build voice request
-    voice_request = router.parse_request({
+    voice_request = _TEST_ADAPTER.parse_request({
         "platform": "siri",  # Use Siri adapter for test harness
         "userId": user_id,
         "sessionId": conv_id,
@@ -673,8 +967,8 @@ def test_start():
     # Handle request
     voice_response = unified_handler.handle_download(voice_request)
 
-    # Load state to get result count
-    state = load_state(user_id, conv_id)
+    # Reuse the state the handler just saved; only hit the DB if it returned none
+    state = voice_response.state if voice_response.state is not None else load_state(user_id, conv_id)
 
     result = {
         "userId": user_id,
@@ -692,7 +986,7 @@ def test_start():
     return jsonify(result)
 
 
-@app.route('/test/yes', methods=['POST'])
+@test_bp.route('/yes', methods=['POST'])
 def test_yes():
     """Confirm selection (test harness)"""
     data = request.get_json(silent=True) or {}
@@ -703,7 +997,7 @@ def test_yes():
         return jsonify({"error": "conversationId is required"}), 400
 
     # Build voice request
-    voice_request = router.parse_request({
+    voice_request = _TEST_ADAPTER.parse_request({
         "platform": "siri",
         "userId": user_id,
         "sessionId": conv_id,
@@ -722,7 +1016,7 @@ def test_yes():
 
     # Check if request was created
     if "requested" in voice_response.speech.lower() or "okay" in voice_response.speech.lower():
-        state = load_state(user_id, conv_id)
+        state = voice_response.state if voice_response.state is not None else load_state(user_id, conv_id)
         if state and state.get('results'):
             chosen = state['results'][state.get('index', 0)]
             result["requested"] = {
@@ -733,7 +1027,7 @@ def test_yes():
     return jsonify(result)
 
 
-@app.route('/test/no', methods=['POST'])
+@test_bp.route('/no', methods=['POST'])
 def test_no():
     """Move to next result (test harness)"""
     data = request.get_json(silent=True) or {}
@@ -744,7 +1038,7 @@ def test_no():
         return jsonify({"error": "conversationId is required"}), 400
 
     # Build voice request
-    voice_request = router.parse_request({
+    voice_request = _TEST_ADAPTER.parse_request({
         "platform": "siri",
         "userId": user_id,
         "sessionId": conv_id,
@@ -755,8 +1049,8 @@ def test_no():
     # Handle request
     voice_response = unified_handler.handle_no(voice_request)
 
-    # Load updated state
-    state = load_state(user_id, conv_id)
+    # Reuse the updated state from the handler; only hit the DB if it returned none
+    state = voice_response.state if voice_response.state is not None else load_state(user_id, conv_id)
 
     result = {
         "speech": voice_response.speech,
@@ -773,7 +1067,7 @@ def test_no():
     return jsonify(result)
 
 
-@app.route('/test/state', methods=['GET'])
+@test_bp.route('/state', methods=['GET'])
 def test_state():
     """Get conversation state (test harness)"""
     user_id = request.args.get('userId', 'test-user')
@@ -786,7 +1080,7 @@ def test_state():
     return jsonify({"state": state})
 
 
-@app.route('/test/reset', methods=['POST'])
+@test_bp.route('/reset', methods=['POST'])
 def test_reset():
     """Reset conversation state (test harness)"""
     data = request.get_json(silent=True) or {}
@@ -801,12 +1095,13 @@ def test_reset():
             SessionState.user_id == user_id,
             SessionState.conversation_id == conv_id
         )
-        deleted = q.delete()
+        deleted = q.delete(synchronize_session=False)
 
+    invalidate_stats_cache()
     return jsonify({"ok": True, "deleted": deleted})
 
 
-@app.route('/test/purge', methods=['POST'])
+@test_bp.route('/purge', methods=['POST'])
 def test_purge():
     """Purge all or user-specific state (test harness)"""
     data = request.get_json(silent=True) or {}
@@ -815,33 +1110,65 @@ def test_purge():
     with db_session() as s:
         if user_id:
             q = s.query(SessionState).filter(SessionState.user_id == user_id)
-            deleted = q.delete()
+            deleted = q.delete(synchronize_session=False)
         else:
-            deleted = s.query(SessionState).delete()
+            deleted = s.query(SessionState).delete(synchronize_session=False)
 
+    invalidate_stats_cache()
     return jsonify({"ok": True, "deleted": deleted})
 
 
+# Without credentials configured there's nothing to check, so skip the hook
+if Config.BASIC_AUTH_USER and Config.BASIC_AUTH_PASS:
+    test_bp.before_request(protect_test_endpoints)
+app.register_blueprint(test_bp)
+
+
 # ========================================
 # MAINTENANCE ENDPOINTS
 # ========================================
 
+# Backend connectivity as seen by /health, refreshed at most every
+# _CONN_TTL seconds so frequent monitor polling doesn't hit the backend each time
+_CONN_TTL = 30
+_conn_cache = {'ts': 0.0, 'status': None}
+_conn_lock = threading.Lock()
+
+
+def _backend_status() -> str:
+    """Cached backend connectivity status: connected / unreachable / error"""
+    if time.monotonic() - _conn_cache['ts'] < _CONN_TTL and _conn_cache['status']:
+        return _conn_cache['status']
+
+    # One thread refreshes; concurrent callers serve the previous value if there is one
+    if not _conn_lock.acquire(blocking=_conn_cache['status'] is None):
+        return _conn_cache['status']
+    try:
+        if time.monotonic() - _conn_cache['ts'] < _CONN_TTL and _conn_cache['status']:
+            return _conn_cache['status']
+        try:
+            status = "connected" if Config.check_connectivity() else "unreachable"
+        except Exception:
+            status = "error"
+        _conn_cache['status'] = status
+        _conn_cache['ts'] = time.monotonic()
+        return status
+    finally:
+        _conn_lock.release()
+
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint for monitoring"""
     try:
+        # Check backend (if not in mock mode) alongside the database
+        status_future = None if Config.MOCK_BACKEND else _IO_POOL.submit(_backend_status)
+
         # Check database
         with db_session() as s:
-            count = s.query(SessionState).count()
+            count = s.execute(select(func.count()).select_from(SessionState)).scalar_one()
 
-        # Check backend (if not in mock mode)
-        overseerr_status = "mock" if Config.MOCK_BACKEND else "connected"
-        if not Config.MOCK_BACKEND:
-            try:
-                # Quick connectivity check
-                overseerr_status = "connected" if Config.check_connectivity() else "unreachable"
-            except:
-                overseerr_status = "error"
+        overseerr_status = "mock" if status_future is None else status_future.result()
 
         return jsonify({
             "status": "healthy",
@@ -865,6 +1192,7 @@ def cleanup_endpoint():
     try:
         hours = request.args.get('hours', Config.SESSION_TTL_HOURS, type=int)
         deleted = cleanup_old_sessions(hours=hours)
+        invalidate_stats_cache()
 
         logger.info(f"Cleanup completed: {deleted} sessions deleted")
 
@@ -886,15 +1214,21 @@ def cleanup_endpoint():
 @app.route('/config')
 def config_ui():
     """Serve the configuration management UI"""
-    return send_from_directory('static', 'config_ui.html')
+    return send_ui_page('config_ui.html')
+
+
+@functools.cache
+def get_config_manager():
+    """Shared ConfigManager, imported on first use (it holds no per-request state)"""
+    from config_manager import ConfigManager
+    return ConfigManager()
 
 
 @app.route('/api/config', methods=['GET'])
 def get_config():
     """Get current configuration (without sensitive values in production)"""
     try:
-        from config_manager import ConfigManager
-        cm = ConfigManager()
+        cm = get_config_manager()
         config = cm.read_config()
 
         # In production, mask sensitive values for display
@@ -916,8 +1250,7 @@ def get_config():
 def save_config():
     """Save configuration to .env file"""
     try:
-        from config_manager import ConfigManager
-        cm = ConfigManager()
+        cm = get_config_manager()
 
         new_config = request.get_json()
         if not new_config:
@@ -951,6 +1284,9 @@ def save_config():
 
         # Write configuration
         cm.write_config(new_config)
+        overseerr.clear_search_cache()
+        overseerr.clear_details_cache()
+        invalidate_stats_cache()
 
         logger.info("Configuration updated via web UI")
 
@@ -968,8 +1304,7 @@ def save_config():
 def test_backend_connection():
     """Test connection to media backend"""
     try:
-        from config_manager import ConfigManager
-        cm = ConfigManager()
+        cm = get_config_manager()
 
         data = request.get_json()
         if not data or 'url' not in data or 'apiKey' not in data:
@@ -990,8 +1325,7 @@ def test_backend_connection():
 def restart_service():
     """Restart the Overtalkerr service"""
     try:
-        from config_manager import ConfigManager
-        cm = ConfigManager()
+        cm = get_config_manager()
 
         success, message = cm.restart_service()
 
@@ -1033,6 +1367,11 @@ if __name__ == '__main__':
     debug_mode = Config.FLASK_ENV == 'development'
     port = int(os.getenv('PORT', 5000))
     logger.info(f"Starting Overtalkerr in {Config.FLASK_ENV} mode on port {port}")
+    if not debug_mode:
+        logger.warning(
+            "Running on Flask's development server; for production use gunicorn, e.g. "
+            "gunicorn --bind 0.0.0.0:5000 --workers 2 --worker-class gthread --threads 16 app:app"
+        )
 
     app.run(
         host='0.0.0.0',
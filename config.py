@@ -28,6 +28,9 @@ class Config:
     MEDIA_BACKEND_URL: str
     MEDIA_BACKEND_API_KEY: str
     MOCK_BACKEND: bool
+    BACKEND_POOL_CONNECTIONS: int  # Per-host connection pools kept by the backend session
+    BACKEND_POOL_MAXSIZE: int  # Keep-alive connections reused per host
+    BACKEND_CONCURRENCY: int  # Worker threads for concurrent backend calls
 
     # Database
     DATABASE_URL: str
@@ -51,6 +54,13 @@ class Config:
     HA_WEBHOOK_SECRET: Optional[str]  # Optional webhook authentication secret
     HA_ENABLED: bool  # Enable/disable Home Assistant integration
 
+    # Derived at load time for the dashboard
+    BACKEND_CONFIGURED: bool  # Backend URL set and not the sample placeholder
+    CONFIG_COMPLETE: bool  # Backend URL, API key and public URL all set
+
+    # Backend URL shipped in the sample .env
+    _PLACEHOLDER_BACKEND_URL = "http://your-backend-url:5055"
+
     @classmethod
     def load(cls) -> None:
         """Load and validate all configuration"""
@@ -69,6 +79,11 @@ class Config:
             cls.MEDIA_BACKEND_URL = cls._get_required("MEDIA_BACKEND_URL")
             cls.MEDIA_BACKEND_API_KEY = cls._get_required("MEDIA_BACKEND_API_KEY")
 
+        # Sized for 16 request threads per worker plus background refreshes
+        cls.BACKEND_POOL_CONNECTIONS = int(os.getenv("BACKEND_POOL_CONNECTIONS", "20"))
+        cls.BACKEND_POOL_MAXSIZE = int(os.getenv("BACKEND_POOL_MAXSIZE", "50"))
+        cls.BACKEND_CONCURRENCY = int(os.getenv("BACKEND_CONCURRENCY", "16"))
+
         # Database
         cls.DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./overtalkerr.db")
         cls.SESSION_TTL_HOURS = int(os.getenv("SESSION_TTL_HOURS", "24"))
@@ -95,6 +110,9 @@ class Config:
         # Validate configuration
         cls._validate()
 
+        cls.BACKEND_CONFIGURED = bool(cls.MEDIA_BACKEND_URL) and cls.MEDIA_BACKEND_URL != cls._PLACEHOLDER_BACKEND_URL
+        cls.CONFIG_COMPLETE = bool(cls.MEDIA_BACKEND_URL and cls.MEDIA_BACKEND_API_KEY and cls.PUBLIC_BASE_URL)
+
         logger.info("Configuration loaded successfully", extra={
             "flask_env": cls.FLASK_ENV,
             "mock_mode": cls.MOCK_BACKEND,
@@ -4,10 +4,40 @@ Configuration file management for .env file.
 Provides safe reading and writing of environment variables
 while preserving comments and formatting.
 """
+import io
 import os
 import re
-from typing import Dict, Optional
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
 from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# A KEY=VALUE line, ignoring surrounding whitespace (comments never match)
+_ENV_LINE_RE = re.compile(r'^[^\S\n]*([A-Z_]+)=(.*?)[^\S\n]*$', re.MULTILINE)
+_ENV_KEY_RE = re.compile(r'^([A-Z_]+)=')
+
+# Connection tests from the config UI reuse keep-alive connections; no retries,
+# a failed probe should fail fast
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+
+_PROBE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='config-probe')
+
+_URL_SCHEMES = frozenset(('http', 'https'))
+
+
+def _is_http_url(url: str) -> bool:
+    """An http(s) URL with a host; rejects typos like 'https:/host' that a prefix check lets through"""
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return False
+    return parts.scheme in _URL_SCHEMES and bool(parts.netloc)
 
 
 class ConfigManager:
@@ -33,21 +63,10 @@ class ConfigManager:
             else:
                 return config
 
-        with open(self.env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-
-                # Skip comments and empty lines
-                if not line or line.startswith('#'):
-                    continue
-
-                # Parse KEY=VALUE
-                match = re.match(r'^([A-Z_]+)=(.*)$', line)
-                if match:
-                    key, value = match.groups()
-                    # Remove quotes if present
-                    value = value.strip('"').strip("'")
-                    config[key] = value
+        # One read, then a single regex pass over the whole file
+        for key, value in _ENV_LINE_RE.findall(self.env_file.read_text()):
+            # Remove quotes if present
+            config[key] = value.strip('"').strip("'")
 
         return config
 
@@ -61,44 +80,43 @@ class ConfigManager:
         # Read existing file to preserve comments and structure
         existing_lines = []
         if self.env_file.exists():
-            with open(self.env_file, 'r') as f:
-                existing_lines = f.readlines()
+            existing_lines = self.env_file.read_text().splitlines(keepends=True)
 
         # Build new file content
-        new_lines = []
+        buf = io.StringIO()
         updated_keys = set()
 
         for line in existing_lines:
-            stripped = line.strip()
-
-            # Preserve comments and empty lines
-            if not stripped or stripped.startswith('#'):
-                new_lines.append(line)
-                continue
-
-            # Update existing KEY=VALUE lines
-            match = re.match(r'^([A-Z_]+)=', stripped)
-            if match:
+            # Update existing KEY=VALUE lines; comments, blanks and anything
+            # else are kept as-is
+            match = _ENV_KEY_RE.match(line.strip())
+            if match and match.group(1) in config:
                 key = match.group(1)
-                if key in config:
-                    # Update with new value
-                    new_lines.append(f"{key}={config[key]}\n")
-                    updated_keys.add(key)
-                else:
-                    # Keep existing line
-                    new_lines.append(line)
+                buf.write(f"{key}={config[key]}\n")
+                updated_keys.add(key)
             else:
-                # Keep any other lines
-                new_lines.append(line)
+                buf.write(line)
 
         # Add any new keys that weren't in the original file
         for key, value in config.items():
             if key not in updated_keys:
-                new_lines.append(f"{key}={value}\n")
+                buf.write(f"{key}={value}\n")
+
+        self._replace_env_file(buf.getvalue())
 
-        # Write back to file
-        with open(self.env_file, 'w') as f:
-            f.writelines(new_lines)
+    def _replace_env_file(self, content: str) -> None:
+        """Write the .env file via a temp file and rename, so a crash can't leave it half-written"""
+        tmp = self.env_file.with_name(self.env_file.name + '.tmp')
+        try:
+            tmp.write_text(content)
+            if self.env_file.exists():
+                # Keep restrictive permissions on a file holding API keys
+                shutil.copymode(self.env_file, tmp)
+            os.replace(tmp, self.env_file)
+        except OSError:
+            # e.g. .env bind-mounted into a container, which can't be renamed over
+            tmp.unlink(missing_ok=True)
+            self.env_file.write_text(content)
 
     def test_backend_connection(self, url: str, api_key: str) -> Dict[str, any]:
         """
@@ -111,12 +129,27 @@ class ConfigManager:
         Returns:
             Dictionary with success status and details
         """
-        import requests
+        # Probe both APIs at once so an unreachable Overseerr endpoint doesn't
+        # delay the Ombi check by its full timeout; Overseerr wins if both answer
+        overseerr = _PROBE_POOL.submit(self._probe_overseerr, url, api_key)
+        ombi = _PROBE_POOL.submit(self._probe_ombi, url, api_key)
+
+        result = overseerr.result() or ombi.result()
+        if result:
+            return result
 
-        # Try Overseerr/Jellyseerr API
+        # Both failed
+        return {
+            "success": False,
+            "error": "Could not connect to backend. Check URL and API key."
+        }
+
+    @staticmethod
+    def _probe_overseerr(url: str, api_key: str) -> Optional[Dict[str, Any]]:
+        """Try the Overseerr/Jellyseerr status API"""
         try:
             headers = {"X-Api-Key": api_key}
-            response = requests.get(f"{url}/api/v1/status", headers=headers, timeout=5)
+            response = _SESSION.get(f"{url}/api/v1/status", headers=headers, timeout=5)
 
             if response.ok:
                 data = response.json()
@@ -134,13 +167,16 @@ class ConfigManager:
                     "version": version,
                     "message": f"Version {version}"
                 }
-        except Exception as e:
+        except Exception:
             pass
+        return None
 
-        # Try Ombi API
+    @staticmethod
+    def _probe_ombi(url: str, api_key: str) -> Optional[Dict[str, Any]]:
+        """Try the Ombi status API"""
         try:
             headers = {"ApiKey": api_key}
-            response = requests.get(f"{url}/api/v1/Status", headers=headers, timeout=5)
+            response = _SESSION.get(f"{url}/api/v1/Status", headers=headers, timeout=5)
 
             if response.ok:
                 return {
@@ -148,14 +184,9 @@ class ConfigManager:
                     "backend_type": "Ombi",
                     "message": "Connection successful"
                 }
-        except Exception as e:
+        except Exception:
             pass
-
-        # Both failed
-        return {
-            "success": False,
-            "error": "Could not connect to backend. Check URL and API key."
-        }
+        return None
 
     def validate_config(self, config: Dict[str, str]) -> tuple[bool, Optional[str]]:
         """
@@ -170,18 +201,15 @@ class ConfigManager:
         # Check required fields
         required_fields = ['MEDIA_BACKEND_URL', 'MEDIA_BACKEND_API_KEY']
 
-        for field in required_fields:
-            if field not in config or not config[field]:
-                return False, f"Missing required field: {field}"
+        missing = [field for field in required_fields if not config.get(field)]
+        if missing:
+            return False, f"Missing required field: {missing[0]}"
 
         # Validate URL format
-        backend_url = config.get('MEDIA_BACKEND_URL', '')
-        if backend_url and not backend_url.startswith(('http://', 'https://')):
-            return False, "MEDIA_BACKEND_URL must start with http:// or https://"
-
-        public_url = config.get('PUBLIC_BASE_URL', '')
-        if public_url and not public_url.startswith(('http://', 'https://')):
-            return False, "PUBLIC_BASE_URL must start with http:// or https://"
+        for key in ('MEDIA_BACKEND_URL', 'PUBLIC_BASE_URL'):
+            url = config.get(key, '')
+            if url and not _is_http_url(url):
+                return False, f"{key} must start with http:// or https://"
 
         # Validate numeric values
         try:
@@ -199,6 +227,31 @@ class ConfigManager:
 
         return True, None
 
+    @staticmethod
+    def _exec_restart() -> None:
+        """Re-exec this process once queued session writes have landed"""
+        import sys
+        from logger import logger
+
+        # execv discards everything in memory, including state writes still
+        # queued for the background pool (only loaded by the running app)
+        voice_handler = sys.modules.get('unified_voice_handler')
+        if voice_handler is not None:
+            unfinished = voice_handler.flush_pending_writes()
+            if unfinished:
+                logger.warning(f"Restarting with {unfinished} session state write(s) still pending")
+
+        logger.info("Restarting in place via exec")
+        for handler in logger.handlers:
+            handler.flush()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            os.execv(sys.executable, [sys.executable, *sys.argv])
+        except OSError as e:
+            # Logging is still up, so the failure is recorded
+            logger.error(f"Exec restart failed: {e}")
+
     def restart_service(self) -> tuple[bool, str]:
         """
         Restart the Overtalkerr service.
@@ -227,6 +280,10 @@ class ConfigManager:
                         text=True,
                         timeout=10
                     )
+                elif os.getenv('OVERTALKERR_RESTART_MODE', 'signal').lower() == 'exec':
+                    # Running standalone (python app.py) - replace this process
+                    # in place, skipping a process-manager cold start
+                    self._exec_restart()
                 else:
                     # Running directly (development/docker) - restart via signal
                     import signal
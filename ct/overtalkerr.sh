@@ -152,7 +152,7 @@ ExecStart=/opt/overtalkerr/venv/bin/gunicorn \\
     --bind 0.0.0.0:5000 \\
     --workers 2 \\
     --worker-class gthread \\
-    --threads 4 \\
+    --threads 16 \\
     --timeout 120 \\
     --access-logfile - \\
     --error-logfile - \\
@@ -1,24 +1,87 @@
 import os
 import datetime as dt
 from contextlib import contextmanager
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, create_engine, Index
+from sqlalchemy import Column, Integer, String, LargeBinary, Text, DateTime, create_engine, event, Index, inspect
+from sqlalchemy.engine import make_url
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
+from logger import logger
+
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./overtalkerr.db")
 
+_IS_SQLITE = DATABASE_URL.startswith("sqlite")
+
+# Sized for 16 request threads plus the background state writers per gunicorn
+# worker; 2 workers stay within server defaults (e.g. Postgres' 100 connections).
+# Raise alongside gunicorn --threads, or lower for a shared database.
+_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
+# In-memory SQLite gets a singleton pool, which takes no sizing arguments
+if _IS_SQLITE and make_url(DATABASE_URL).database in (None, "", ":memory:"):
+    _pool_args: Dict[str, Any] = {}
+else:
+    _pool_args = {"pool_size": _POOL_SIZE, "max_overflow": _MAX_OVERFLOW}
+
 # SQLAlchemy 2.0 engine configuration
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {},
-    pool_pre_ping=True,  # Verify connections before using
+    connect_args={"check_same_thread": False} if _IS_SQLITE else {},
+    **_pool_args,
+    # Verify and periodically recycle server connections so idle ones dropped
+    # by the server or a proxy don't fail the next request; a local SQLite file
+    # can't go stale
+    pool_pre_ping=not _IS_SQLITE,
+    pool_recycle=-1 if _IS_SQLITE else 1800,
     echo=False,  # Set to True for SQL debugging
 )
 
+if _IS_SQLITE:
+    @event.listens_for(engine, "connect")
+    def _sqlite_pragmas(dbapi_conn, _record):
+        """WAL lets readers proceed during a write; wait briefly on locks instead of failing"""
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def _has_text_state_column() -> bool:
+    """
+    Check whether an existing session_state table still has a TEXT state_json.
+
+    Tables created before state compression keep that column until
+    migrate_db.py converts it; binary payloads would be rejected there
+    (Postgres bytea vs text, MySQL strict mode). SQLite stores BLOBs in any
+    column, and new tables are created binary.
+    """
+    if _IS_SQLITE:
+        return False
+    inspector = inspect(engine)
+    if not inspector.has_table("session_state"):
+        return False
+    for column in inspector.get_columns("session_state"):
+        if column['name'] == 'state_json':
+            try:
+                return column['type'].python_type is not bytes
+            except NotImplementedError:
+                return False
+    return False
+
+
+# Legacy TEXT column: store state as uncompressed UTF-8 JSON until migrated
+STATE_AS_TEXT = _has_text_state_column()
+if STATE_AS_TEXT:
+    logger.warning("session_state.state_json is a TEXT column - storing uncompressed state; run migrate_db.py to enable compression")
+
+
 class Base(DeclarativeBase):
     """SQLAlchemy 2.0 declarative base"""
     pass
@@ -32,16 +95,19 @@ class SessionState(Base):
     user_id = Column(String(256), index=True, nullable=False)
     # Request id or a logical conversation id
     conversation_id = Column(String(256), index=True, nullable=False)
-    # JSON payload string storing search results and cursor
-    state_json = Column(Text, nullable=False)
+    # zstd-compressed JSON payload storing search results and cursor
+    # (rows from before compression, or a not yet migrated TEXT column, hold plain JSON)
+    state_json = Column(Text if STATE_AS_TEXT else LargeBinary, nullable=False)
     # Timestamp for automatic cleanup
     created_at = Column(DateTime, nullable=False, default=dt.datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=dt.datetime.utcnow, onupdate=dt.datetime.utcnow)
 
     __table_args__ = (
-        # Composite index for faster lookups
-        Index('ix_session_user_conv', 'user_id', 'conversation_id'),
+        # One row per conversation; also the conflict target for upserts
+        Index('ix_session_user_conv', 'user_id', 'conversation_id', unique=True),
         Index('ix_session_created', 'created_at'),
+        # Expiry cleanup and the dashboard's recent-activity queries
+        Index('ix_session_updated', 'updated_at'),
     )
 
 
@@ -49,6 +115,47 @@ class SessionState(Base):
 Base.metadata.create_all(bind=engine)
 
 
+def _ensure_plain_indexes() -> None:
+    """
+    Add any missing non-unique indexes to an existing table.
+
+    create_all() skips tables that already exist, so databases created before
+    an index was added would keep scanning. Plain indexes are always safe to
+    build; the unique session key may conflict with duplicate rows, so that
+    one is left to migrate_db.py.
+    """
+    for index in SessionState.__table__.indexes:
+        if index.unique:
+            continue
+        try:
+            index.create(bind=engine, checkfirst=True)
+        except Exception as e:
+            logger.warning(f"Could not create index {index.name}: {e}")
+
+
+_ensure_plain_indexes()
+
+
+def _has_unique_session_key() -> bool:
+    """Check whether (user_id, conversation_id) is backed by a unique index"""
+    inspector = inspect(engine)
+    key = {'user_id', 'conversation_id'}
+    for idx in inspector.get_indexes(SessionState.__tablename__):
+        if idx.get('unique') and set(idx['column_names']) == key:
+            return True
+    for uc in inspector.get_unique_constraints(SessionState.__tablename__):
+        if set(uc['column_names']) == key:
+            return True
+    return False
+
+
+# Databases created before the unique index existed need `python migrate_db.py`
+# before single-statement upserts can be used
+UPSERT_SUPPORTED = engine.dialect.name in {'sqlite', 'postgresql', 'mysql'} and _has_unique_session_key()
+if not UPSERT_SUPPORTED:
+    logger.warning("session_state has no unique (user_id, conversation_id) index - run migrate_db.py to enable upserts")
+
+
 @contextmanager
 def db_session():
     """Context manager for database sessions with automatic commit/rollback"""
@@ -63,6 +170,35 @@ def db_session():
         session.close()
 
 
+def upsert_session_state(session, user_id: str, conversation_id: str, state_json: Union[bytes, str],
+                         now: Optional[dt.datetime] = None) -> None:
+    """
+    Insert or update a conversation state row in a single statement.
+
+    Requires UPSERT_SUPPORTED; callers fall back to SELECT-then-write otherwise.
+    """
+    now = now or dt.datetime.utcnow()
+    values = {
+        'user_id': user_id,
+        'conversation_id': conversation_id,
+        'state_json': state_json,
+        'created_at': now,
+        'updated_at': now,
+    }
+    changes = {'state_json': state_json, 'updated_at': now}
+
+    dialect = engine.dialect.name
+    if dialect == 'mysql':
+        stmt = mysql.insert(SessionState).values(**values).on_duplicate_key_update(**changes)
+    else:
+        insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+        stmt = insert(SessionState).values(**values).on_conflict_do_update(
+            index_elements=['user_id', 'conversation_id'],
+            set_=changes,
+        )
+    session.execute(stmt)
+
+
 def cleanup_old_sessions(hours: int = 24) -> int:
     """
     Delete conversation states older than specified hours.
@@ -75,5 +211,11 @@ def cleanup_old_sessions(hours: int = 24) -> int:
     """
     cutoff = dt.datetime.utcnow() - dt.timedelta(hours=hours)
     with db_session() as s:
-        deleted = s.query(SessionState).filter(SessionState.created_at < cutoff).delete()
+        # Expire by last activity so long-running conversations aren't cut off;
+        # one DELETE statement, no need to sync ORM objects we never loaded
+        deleted = (
+            s.query(SessionState)
+            .filter(SessionState.updated_at < cutoff)
+            .delete(synchronize_session=False)
+        )
         return deleted
@@ -6,7 +6,7 @@ docker pull ghcr.io/mscodemonkey/overtalkerr:latest
 docker stop overtalkerr || true
 docker rm overtalkerr || true
 
-# Recreate container with same settings
+# Recreate container with same settings (database migrations run on start)
 docker run -d \
   --name=overtalkerr \
   -e PUID=1000 -e PGID=1000 \
@@ -0,0 +1,10 @@
+#!/bin/sh
+# Bring an existing database up to the current schema, then start the server
+set -e
+
+if ! python /app/migrate_db.py; then
+    echo "❌ Database migration failed - not starting Overtalkerr" >&2
+    exit 1
+fi
+
+exec "$@"
@@ -9,12 +9,30 @@ Features:
 - Trending/popular content discovery
 - Smart query parsing
 """
+import logging
 import re
+from collections import Counter
+from datetime import datetime
+from operator import itemgetter
 from typing import List, Dict, Any, Optional, Tuple
 from rapidfuzz import fuzz, process
 import dateparser
+from config import Config
 from logger import logger
 
+_WS_RE = re.compile(r'\s+')
+_FROM_YEAR_RE = re.compile(r'from\s+(\d{4})', re.IGNORECASE)
+# Year keywords in TEMPORAL_KEYWORDS, as years back from the current one
+_YEARS_AGO = {'current_year': 0, 'last_year': 1}
+
+# Similarity scorers for fuzzy_match_results; a title's score is the best of these
+_FUZZY_SCORERS = (fuzz.ratio, fuzz.partial_ratio, fuzz.token_sort_ratio, fuzz.token_set_ratio)
+
+
+def _result_title(result: Dict[str, Any]) -> str:
+    """Display title of a search result (movies have 'title', TV shows 'name')"""
+    return result.get('_title', result.get('title', result.get('name', '')))
+
 
 class SearchEnhancer:
     """Enhances search queries with fuzzy matching and NLP"""
@@ -65,17 +83,51 @@ class SearchEnhancer:
         'last year': 'last_year',
     }
 
+    # Patterns for the keyword tables above, compiled once
+    # All substitutions in one alternation, so the query is scanned once
+    # however large the table grows (longest first, like the keyword tables)
+    _TYPO_ALT = re.compile(
+        '|'.join(re.escape(w) for w in sorted(COMMON_SUBSTITUTIONS, key=len, reverse=True)),
+        re.IGNORECASE,
+    )
+    _CAST_PATTERNS = [
+        re.compile(rf'\b{re.escape(indicator)}\s+([a-zA-Z\s]+?)(?:\s|$)', re.IGNORECASE)
+        for indicator in CAST_INDICATORS
+    ]
+    # Genre and temporal keywords are found with one alternation scan; when
+    # several appear, the one listed first in the table wins. The per-keyword
+    # pattern then strips every occurrence of the chosen keyword.
+    _GENRE_BY_KEYWORD = {
+        keyword: (priority, genre)
+        for priority, (keyword, genre) in enumerate(
+            (kw, g) for g, kws in GENRE_KEYWORDS.items() for kw in kws
+        )
+    }
+    _TEMPORAL_PRIORITY = {keyword: priority for priority, keyword in enumerate(TEMPORAL_KEYWORDS)}
+    _KEYWORD_PATTERNS = {
+        keyword: re.compile(rf'\b{re.escape(keyword)}\b', re.IGNORECASE)
+        for keyword in [*_GENRE_BY_KEYWORD, *TEMPORAL_KEYWORDS]
+    }
+    # Longest first so a keyword never loses to a shorter one starting at the same place
+    _GENRE_ALT = re.compile(
+        r'\b(' + '|'.join(re.escape(k) for k in sorted(_GENRE_BY_KEYWORD, key=len, reverse=True)) + r')\b',
+        re.IGNORECASE,
+    )
+    _TEMPORAL_ALT = re.compile(
+        r'\b(' + '|'.join(re.escape(k) for k in sorted(TEMPORAL_KEYWORDS, key=len, reverse=True)) + r')\b',
+        re.IGNORECASE,
+    )
+
     @staticmethod
     def correct_common_typos(query: str) -> str:
         """Correct common typos and speech recognition errors"""
-        query_lower = query.lower()
-
-        for wrong, correct in SearchEnhancer.COMMON_SUBSTITUTIONS.items():
-            if wrong in query_lower:
-                query = re.sub(re.escape(wrong), correct, query, flags=re.IGNORECASE)
-                logger.debug(f"Corrected typo: '{wrong}' -> '{correct}'")
+        def substitute(match: re.Match) -> str:
+            wrong = match.group(0).lower()
+            correct = SearchEnhancer.COMMON_SUBSTITUTIONS[wrong]
+            logger.debug("Corrected typo: '%s' -> '%s'", wrong, correct)
+            return correct
 
-        return query
+        return SearchEnhancer._TYPO_ALT.sub(substitute, query)
 
     @staticmethod
     def extract_cast_info(query: str) -> Tuple[str, Optional[str]]:
@@ -85,13 +137,12 @@ class SearchEnhancer:
         Returns:
             (cleaned_query, cast_member_name)
         """
-        for indicator in SearchEnhancer.CAST_INDICATORS:
-            pattern = rf'\b{re.escape(indicator)}\s+([a-zA-Z\s]+?)(?:\s|$)'
-            match = re.search(pattern, query, re.IGNORECASE)
+        for pattern in SearchEnhancer._CAST_PATTERNS:
+            match = pattern.search(query)
             if match:
                 cast_name = match.group(1).strip()
-                cleaned_query = re.sub(pattern, '', query, flags=re.IGNORECASE).strip()
-                logger.info(f"Extracted cast: '{cast_name}' from query")
+                cleaned_query = pattern.sub('', query).strip()
+                logger.info("Extracted cast: '%s' from query", cast_name)
                 return cleaned_query, cast_name
 
         return query, None
@@ -104,18 +155,16 @@ class SearchEnhancer:
         Returns:
             (cleaned_query, genre)
         """
-        query_lower = query.lower()
+        found = SearchEnhancer._GENRE_ALT.findall(query)
+        if not found:
+            return query, None
 
-        for genre, keywords in SearchEnhancer.GENRE_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in query_lower:
-                    # Remove genre keyword from query
-                    cleaned = re.sub(rf'\b{re.escape(keyword)}\b', '', query, flags=re.IGNORECASE)
-                    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-                    logger.info(f"Extracted genre: '{genre}' from keyword '{keyword}'")
-                    return cleaned, genre
-
-        return query, None
+        keyword = min((k.lower() for k in found), key=lambda k: SearchEnhancer._GENRE_BY_KEYWORD[k][0])
+        genre = SearchEnhancer._GENRE_BY_KEYWORD[keyword][1]
+        # Remove genre keyword from query
+        cleaned = _WS_RE.sub(' ', SearchEnhancer._KEYWORD_PATTERNS[keyword].sub('', query)).strip()
+        logger.info("Extracted genre: '%s' from keyword '%s'", genre, keyword)
+        return cleaned, genre
 
     @staticmethod
     def extract_temporal_info(query: str) -> Tuple[str, Optional[Dict[str, Any]]]:
@@ -126,33 +175,28 @@ class SearchEnhancer:
             (cleaned_query, temporal_filter)
             temporal_filter: {'type': 'relative', 'days': 90} or {'type': 'year', 'year': 2023}
         """
-        query_lower = query.lower()
-
         # Check for temporal keywords
-        for keyword, value in SearchEnhancer.TEMPORAL_KEYWORDS.items():
-            if keyword in query_lower:
-                cleaned = re.sub(rf'\b{re.escape(keyword)}\b', '', query, flags=re.IGNORECASE)
-                cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-
-                if isinstance(value, int):
-                    temporal_filter = {'type': 'relative', 'days': value}
-                elif value == 'current_year':
-                    from datetime import datetime
-                    temporal_filter = {'type': 'year', 'year': datetime.now().year}
-                elif value == 'last_year':
-                    from datetime import datetime
-                    temporal_filter = {'type': 'year', 'year': datetime.now().year - 1}
-
-                logger.info(f"Extracted temporal filter: {temporal_filter}")
-                return cleaned, temporal_filter
+        found = SearchEnhancer._TEMPORAL_ALT.findall(query)
+        if found:
+            keyword = min((k.lower() for k in found), key=SearchEnhancer._TEMPORAL_PRIORITY.__getitem__)
+            value = SearchEnhancer.TEMPORAL_KEYWORDS[keyword]
+            cleaned = _WS_RE.sub(' ', SearchEnhancer._KEYWORD_PATTERNS[keyword].sub('', query)).strip()
+
+            if isinstance(value, int):
+                temporal_filter = {'type': 'relative', 'days': value}
+            else:
+                temporal_filter = {'type': 'year', 'year': datetime.now().year - _YEARS_AGO[value]}
+
+            logger.info("Extracted temporal filter: %s", temporal_filter)
+            return cleaned, temporal_filter
 
         # Try natural language date parsing
-        date_match = re.search(r'from\s+(\d{4})', query, re.IGNORECASE)
+        date_match = _FROM_YEAR_RE.search(query)
         if date_match:
             year = int(date_match.group(1))
-            cleaned = re.sub(r'from\s+\d{4}', '', query, flags=re.IGNORECASE).strip()
+            cleaned = _FROM_YEAR_RE.sub('', query).strip()
             temporal_filter = {'type': 'year', 'year': year}
-            logger.info(f"Extracted year filter: {year}")
+            logger.info("Extracted year filter: %s", year)
             return cleaned, temporal_filter
 
         return query, None
@@ -184,7 +228,7 @@ class SearchEnhancer:
         query, temporal = SearchEnhancer.extract_temporal_info(query)
 
         # Clean up extra whitespace
-        query = re.sub(r'\s+', ' ', query).strip()
+        query = _WS_RE.sub(' ', query).strip()
 
         result = {
             'cleaned_query': query,
@@ -194,7 +238,7 @@ class SearchEnhancer:
             'original': original
         }
 
-        logger.info(f"Enhanced query parsing: {result}")
+        logger.info("Enhanced query parsing: %s", result)
         return result
 
     @staticmethod
@@ -233,8 +277,6 @@ class SearchEnhancer:
         Returns:
             True if language is allowed or no language filter is set, False otherwise
         """
-        from config import Config
-
         # If no language filter configured, allow all
         if not Config.LANGUAGE_FILTER:
             return True
@@ -272,22 +314,43 @@ class SearchEnhancer:
             return results
 
         query_lower = query.lower().strip()
-        scored_results = []
+        scored = []
 
+        # Filter first, lowercasing each surviving title once
+        is_low_quality = SearchEnhancer.is_low_quality_result
+        is_allowed_language = SearchEnhancer.is_allowed_language
+        candidates = []
         for result in results:
             # Skip low-quality results
-            if SearchEnhancer.is_low_quality_result(result):
-                logger.debug(f"Filtering low-quality result: {result.get('title', 'unknown')} ({result.get('releaseDate', 'no date')})")
+            if is_low_quality(result):
+                logger.debug("Filtering low-quality result: %s (%s)",
+                             result.get('title', 'unknown'), result.get('releaseDate', 'no date'))
                 continue
 
             # Skip results not in allowed languages
-            if not SearchEnhancer.is_allowed_language(result):
+            if not is_allowed_language(result):
                 original_lang = result.get('originalLanguage', 'unknown')
-                logger.debug(f"Filtering non-allowed language: {result.get('title', 'unknown')} (language: {original_lang})")
+                logger.debug("Filtering non-allowed language: %s (language: %s)",
+                             result.get('title', 'unknown'), original_lang)
                 continue
-            title = result.get('_title', result.get('title', result.get('name', '')))
-            title_lower = title.lower().strip()
-
+            candidates.append((result, _result_title(result).lower().strip()))
+
+        # Best of the four similarity scores per title; each scorer runs over the
+        # whole title list in one rapidfuzz call instead of once per result
+        titles_lower = [title_lower for _, title_lower in candidates]
+        best_scores = [0.0] * len(titles_lower)
+        pending = list(range(len(titles_lower)))
+        for scorer in _FUZZY_SCORERS:
+            for _, score, pos in process.extract(query_lower, [titles_lower[i] for i in pending], scorer=scorer, limit=None):
+                idx = pending[pos]
+                if score > best_scores[idx]:
+                    best_scores[idx] = score
+            # A perfect score can't be beaten, so later scorers skip those titles
+            pending = [i for i in pending if best_scores[i] < 100]
+            if not pending:
+                break
+
+        for (result, title_lower), best_score in zip(candidates, best_scores):
             # Determine match tier
             match_tier = 4  # Default: fuzzy match
             bonus = 0
@@ -309,29 +372,27 @@ class SearchEnhancer:
                 match_tier = 3
                 bonus = 100
 
-            # Calculate multiple similarity scores
-            ratio = fuzz.ratio(query_lower, title_lower)
-            partial = fuzz.partial_ratio(query_lower, title_lower)
-            token_sort = fuzz.token_sort_ratio(query_lower, title_lower)
-            token_set = fuzz.token_set_ratio(query_lower, title_lower)
-
-            # Use the best score
-            best_score = max(ratio, partial, token_sort, token_set)
-
             # For exact/starts/contains matches, always include regardless of threshold
             # For fuzzy matches, apply threshold
             if match_tier <= 3 or best_score >= threshold:
-                result_copy = result.copy()
-                result_copy['_fuzzy_score'] = best_score
-                result_copy['_match_tier'] = match_tier
                 # Combined score for sorting: tier matters most, then fuzzy score
-                result_copy['_combined_score'] = bonus + best_score
-                scored_results.append(result_copy)
+                scored.append((bonus + best_score, best_score, match_tier, result))
 
-        # Sort by match tier (ascending), then by fuzzy score (descending)
-        scored_results.sort(key=lambda x: (-x.get('_combined_score', 0)))
+        # Sort by match tier (ascending), then by fuzzy score (descending);
+        # stable, so ties keep the backend's order
+        scored.sort(key=itemgetter(0), reverse=True)
 
-        logger.info(f"Intelligent matching: {len(scored_results)} results (Tier 1: {sum(1 for r in scored_results if r.get('_match_tier') == 1)}, Tier 2: {sum(1 for r in scored_results if r.get('_match_tier') == 2)}, Tier 3: {sum(1 for r in scored_results if r.get('_match_tier') == 3)}, Fuzzy: {sum(1 for r in scored_results if r.get('_match_tier') == 4)})")
+        # Annotated copies, built in a single dict display each; the backend's
+        # (possibly cached) result dicts are never modified
+        scored_results = [
+            {**result, '_fuzzy_score': best_score, '_match_tier': match_tier, '_combined_score': combined}
+            for combined, best_score, match_tier, result in scored
+        ]
+
+        if logger.isEnabledFor(logging.INFO):
+            tiers = Counter(r.get('_match_tier') for r in scored_results)
+            logger.info("Intelligent matching: %d results (Tier 1: %d, Tier 2: %d, Tier 3: %d, Fuzzy: %d)",
+                        len(scored_results), tiers[1], tiers[2], tiers[3], tiers[4])
 
         return scored_results
 
@@ -342,27 +403,30 @@ class SearchEnhancer:
 
         Args:
             query: User's search query
-            known_titles: List of known titles to match against
+            known_titles: List of known titles to match against (or search
+                results, whose titles are used)
             limit: Maximum number of suggestions
 
         Returns:
             List of (title, score) tuples
         """
+        if known_titles and isinstance(known_titles[0], dict):
+            known_titles = [_result_title(result) for result in known_titles]
         if not known_titles:
             return []
 
-        # Use rapidfuzz to find best matches
+        # Use rapidfuzz to find best matches; low scores are dropped inside the
+        # C scan rather than filtered afterwards
         matches = process.extract(
             query,
             known_titles,
             scorer=fuzz.WRatio,
-            limit=limit
+            limit=limit,
+            score_cutoff=60
         )
+        suggestions = [(title, score) for title, score, _ in matches]
 
-        # Filter out low scores
-        suggestions = [(match[0], match[1]) for match in matches if match[1] >= 60]
-
-        logger.info(f"Generated {len(suggestions)} suggestions for query '{query}'")
+        logger.info("Generated %d suggestions for query '%s'", len(suggestions), query)
 
         return suggestions
 
@@ -380,7 +444,7 @@ class SearchEnhancer:
             return results
 
         # TODO: Implement genre ID mapping when Overseerr provides genre data
-        logger.info(f"Genre filtering for '{genre}' - implementation pending genre data from API")
+        logger.info("Genre filtering for '%s' - implementation pending genre data from API", genre)
         return results
 
     @staticmethod
@@ -391,7 +455,7 @@ class SearchEnhancer:
         Note: This would require additional API calls to TMDB for cast info.
         Consider implementing if needed.
         """
-        logger.info(f"Cast filtering for '{cast_name}' - requires TMDB API integration")
+        logger.info("Cast filtering for '%s' - requires TMDB API integration", cast_name)
         return results
 
     @staticmethod
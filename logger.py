@@ -6,9 +6,16 @@ import sys
 import logging
 from pythonjsonlogger import jsonlogger
 
+try:
+    # Serializes records in C; falls back to the stdlib json formatter
+    from pythonjsonlogger.orjson import OrjsonFormatter as _JsonFormatter
+except ImportError:
+    _JsonFormatter = jsonlogger.JsonFormatter
+
 # Determine log level from environment
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 LOG_FORMAT = os.getenv("LOG_FORMAT", "json")  # json or text
+_LEVEL = getattr(logging, LOG_LEVEL, logging.INFO)
 
 
 def setup_logger(name: str = "overtalkerr") -> logging.Logger:
@@ -22,19 +29,22 @@ def setup_logger(name: str = "overtalkerr") -> logging.Logger:
         Configured logger instance
     """
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
+    # Already set up by an earlier import; don't stack another handler
+    if getattr(logger, "_overtalkerr_configured", False):
+        return logger
+    logger.setLevel(_LEVEL)
 
     # Remove existing handlers to avoid duplicates
     logger.handlers.clear()
 
     # Create console handler
     handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
+    handler.setLevel(_LEVEL)
 
     # Configure formatter based on LOG_FORMAT
     if LOG_FORMAT == "json":
         # JSON formatter for production (better for log aggregation)
-        formatter = jsonlogger.JsonFormatter(
+        formatter = _JsonFormatter(
             fmt="%(asctime)s %(name)s %(levelname)s %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S"
         )
@@ -50,6 +60,7 @@ def setup_logger(name: str = "overtalkerr") -> logging.Logger:
 
     # Prevent propagation to root logger
     logger.propagate = False
+    logger._overtalkerr_configured = True
 
     return logger
 
@@ -61,7 +72,9 @@ logger = setup_logger()
 # Utility functions for common logging patterns
 def log_request(endpoint: str, user_id: str = None, **kwargs):
     """Log an incoming request"""
-    logger.info(f"Request to {endpoint}", extra={
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info("Request to %s", endpoint, extra={
         "endpoint": endpoint,
         "user_id": user_id,
         **kwargs
@@ -80,7 +93,9 @@ def log_error(message: str, exc: Exception = None, **kwargs):
 def log_overseerr_call(action: str, success: bool, **kwargs):
     """Log Overseerr API calls"""
     level = logging.INFO if success else logging.WARNING
-    logger.log(level, f"Overseerr {action}", extra={
+    if not logger.isEnabledFor(level):
+        return
+    logger.log(level, "Overseerr %s", action, extra={
         "action": action,
         "success": success,
         **kwargs
@@ -9,8 +9,15 @@ Supports:
 This allows Overtalkerr to work with any of these services with minimal configuration.
 """
 import os
-from typing import List, Dict, Any, Optional
+import json
+import time
+import hashlib
+import threading
+import datetime as dt
+import functools
+from typing import List, Dict, Any, Optional, Tuple
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from urllib.parse import quote
 
@@ -18,10 +25,148 @@ import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 from config import Config
 from logger import logger, log_error, log_overseerr_call
 
 
+# Overseerr/Jellyseerr mediaInfo.status values
+_STATUS_UNKNOWN = 1
+_STATUS_PENDING = 2
+_STATUS_PROCESSING = 3
+_STATUS_PARTIALLY_AVAILABLE = 4
+_STATUS_AVAILABLE = 5
+_STATUS_DELETED = 6
+
+_STATUS_TEXT = {
+    _STATUS_UNKNOWN: "unknown",
+    _STATUS_PENDING: "pending",
+    _STATUS_PROCESSING: "processing",
+    _STATUS_PARTIALLY_AVAILABLE: "partially_available",
+    _STATUS_AVAILABLE: "available",
+    _STATUS_DELETED: "deleted",
+}
+
+# Everything normalize_result derives from a status code, in one lookup:
+# (text, available, partially available, pending, processing)
+_STATUS_FIELDS = {
+    code: (text, code == _STATUS_AVAILABLE, code == _STATUS_PARTIALLY_AVAILABLE,
+           code == _STATUS_PENDING, code == _STATUS_PROCESSING)
+    for code, text in _STATUS_TEXT.items()
+}
+_OTHER_STATUS_FIELDS = ("unknown", False, False, False, False)
+
+
+def _json(resp: requests.Response) -> Any:
+    """Decode a response body; orjson parses large search/credits payloads much faster"""
+    return _loads(resp.content)
+
+
+@functools.lru_cache(maxsize=256)
+def _quote_query(query: str) -> str:
+    """Percent-encode a search term for a URL, spaces as %20 (repeat queries are cached)"""
+    return quote(query, safe='')
+
+
+def normalize_release_date(item: Dict[str, Any]) -> Optional[str]:
+    """Overseerr returns either releaseDate (movies) or firstAirDate (tv)"""
+    return item.get("releaseDate") or item.get("firstAirDate")
+
+
+def parse_date(date_str: Optional[str]) -> Optional[dt.date]:
+    """Parse the date part of an ISO date/datetime string, or None"""
+    if not date_str:
+        return None
+    try:
+        return dt.date.fromisoformat(date_str[:10])
+    except Exception:
+        return None
+
+
+# Backend detection probes (startup, dashboard fallback) reuse keep-alive
+# connections; no retries, so an unreachable backend fails within the timeout
+_PROBE_SESSION = requests.Session()
+_PROBE_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+_PROBE_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+
+
+# One pool for all concurrent backend calls (Ombi movie/TV fan-out, detection
+# probes, details prefetch); tasks never wait on each other, so sharing it
+# can't deadlock. Created once and kept within BACKEND_POOL_MAXSIZE.
+io_executor = ThreadPoolExecutor(max_workers=Config.BACKEND_CONCURRENCY, thread_name_prefix='media-backend')
+
+# Consecutive failures before the backend is treated as down, and how long
+# calls then fail fast before the next trial request
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN = 30
+
+
+class _CircuitBreakerSession(requests.Session):
+    """
+    Session that stops calling a backend that keeps failing.
+
+    After _BREAKER_THRESHOLD consecutive timeouts, connection errors or 5xx
+    replies (each already retried), calls raise ConnectionError immediately
+    for _BREAKER_COOLDOWN seconds rather than every voice turn waiting out
+    retries and timeouts. After the cooldown a single trial call goes through
+    while the rest keep failing fast; its outcome closes or reopens the breaker.
+    A read timeout on a non-idempotent call (a request POST that may well have
+    gone through) isn't counted either way.
+    """
+
+    _IDEMPOTENT = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+
+    def __init__(self):
+        super().__init__()
+        self._breaker_lock = threading.Lock()
+        self._failures = 0
+        self._open_until = 0.0
+        self._trial_running = False
+
+    def request(self, method, url, *args, **kwargs):
+        trial = False
+        if self._open_until:
+            with self._breaker_lock:
+                if self._open_until:
+                    if self._trial_running or time.monotonic() < self._open_until:
+                        raise requests.exceptions.ConnectionError("Backend unavailable after repeated failures, retrying shortly")
+                    self._trial_running = trial = True
+        try:
+            resp = super().request(method, url, *args, **kwargs)
+        except requests.exceptions.ReadTimeout:
+            self._record(failed=True, trial=trial, counted=method.upper() in self._IDEMPOTENT)
+            raise
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError, requests.exceptions.RetryError):
+            self._record(failed=True, trial=trial)
+            raise
+        except Exception:
+            # Not a backend failure (bad URL, etc.); just release the trial slot
+            self._record(failed=False, trial=trial, counted=False)
+            raise
+        self._record(failed=resp.status_code >= 500, trial=trial)
+        return resp
+
+    def _record(self, failed: bool, trial: bool, counted: bool = True) -> None:
+        with self._breaker_lock:
+            if trial:
+                self._trial_running = False
+            if not counted:
+                return
+            if not failed:
+                self._failures = 0
+                self._open_until = 0.0
+                return
+            self._failures += 1
+            if self._failures >= _BREAKER_THRESHOLD:
+                self._open_until = time.monotonic() + _BREAKER_COOLDOWN
+                logger.warning(f"Backend failed {self._failures} times in a row, pausing calls for {_BREAKER_COOLDOWN}s")
+
+
 class BackendType(Enum):
     """Supported backend types"""
     OVERSEERR = "overseerr"
@@ -44,6 +189,16 @@ class MediaBackendAuthError(MediaBackendError):
     pass
 
 
+_AUTH_FAILED = frozenset((401, 403))
+
+
+def _check_response(resp: requests.Response) -> None:
+    """Raise MediaBackendAuthError for a rejected API key, HTTPError for other 4xx/5xx"""
+    if resp.status_code in _AUTH_FAILED:
+        raise MediaBackendAuthError("Invalid API key")
+    resp.raise_for_status()
+
+
 class MediaBackend(ABC):
     """Abstract base class for media request backends"""
 
@@ -51,20 +206,43 @@ class MediaBackend(ABC):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
 
-        # Configure retry strategy
+        # Configure retry strategy. POST is deliberately not retried: creating a
+        # request isn't idempotent, and backoff would blow Alexa's 8s budget.
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS", "POST"]
+            allowed_methods=["HEAD", "GET", "OPTIONS"]
         )
 
-        self.session = requests.Session()
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # One pooled keep-alive session per backend, shared by all worker threads
+        self.session = _CircuitBreakerSession()
+        adapter = HTTPAdapter(
+            pool_connections=Config.BACKEND_POOL_CONNECTIONS,
+            pool_maxsize=Config.BACKEND_POOL_MAXSIZE,
+            pool_block=False,
+            max_retries=retry_strategy,
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        # Auth and content headers are sent with every call; set them once
+        self.session.headers.update(self.get_headers())
 
         self.timeout = (5, 30)  # Connect, read timeout
+        # Creating a request has to answer inside a voice turn
+        self.request_timeout = (3, 5)
+        # Cast lookups are optional extras; a slow one is dropped, not waited out
+        self.details_timeout = (3, 5)
+
+    def _unconfirmed_request(self, media_id: int, media_type: str) -> Dict[str, Any]:
+        """
+        Result for a request POST that was sent but not answered in time.
+
+        The backend accepted the connection and body, so the request is almost
+        always created (Overseerr replies slowly while it notifies Radarr/Sonarr).
+        """
+        logger.warning(f"No reply to request for {media_type} {media_id} within {self.request_timeout[1]}s, assuming accepted")
+        return {"message": "Request submitted", "mediaId": media_id, "mediaType": media_type, "unconfirmed": True}
 
     @abstractmethod
     def search(self, query: str, media_type: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -104,27 +282,23 @@ class OverseerrBackend(MediaBackend):
 
     def search(self, query: str, media_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """Search Overseerr"""
-        # Manually encode query to use %20 instead of + for spaces
-        # Some Overseerr versions (especially develop builds) are strict about this
-        encoded_query = quote(query, safe='')
-        url = f"{self.base_url}/api/v1/search?query={encoded_query}"
+        # Manually encode query to use %20 instead of + for spaces (params= would
+        # send +). Some Overseerr versions (especially develop builds) are strict about this
+        url = f"{self.base_url}/api/v1/search?query={_quote_query(query)}"
 
         try:
-            resp = self.session.get(url, headers=self.get_headers(), timeout=self.timeout)
-
-            if resp.status_code in [401, 403]:
-                raise MediaBackendAuthError("Invalid API key")
+            resp = self.session.get(url, timeout=self.timeout)
 
             # Log the response for debugging 400 errors
             if resp.status_code == 400:
                 try:
-                    error_body = resp.json()
+                    error_body = _json(resp)
                     logger.error(f"Overseerr 400 error: {error_body}")
                 except:
                     logger.error(f"Overseerr 400 error (raw): {resp.text}")
 
-            resp.raise_for_status()
-            data = resp.json() or {}
+            _check_response(resp)
+            data = _json(resp) or {}
             results = data.get("results", [])
 
             # Normalize and filter
@@ -163,17 +337,16 @@ class OverseerrBackend(MediaBackend):
                 payload["seasons"] = "all"
 
         try:
-            resp = self.session.post(url, json=payload, headers=self.get_headers(), timeout=self.timeout)
-
-            if resp.status_code in [401, 403]:
-                raise MediaBackendAuthError("Invalid API key")
+            resp = self.session.post(url, json=payload, timeout=self.request_timeout)
 
             if resp.status_code == 409:
                 return {"message": "Media already requested", "mediaId": media_id, "mediaType": media_type}
 
-            resp.raise_for_status()
-            return resp.json()
+            _check_response(resp)
+            return _json(resp)
 
+        except requests.exceptions.ReadTimeout:
+            return self._unconfirmed_request(media_id, media_type)
         except requests.exceptions.Timeout:
             raise MediaBackendConnectionError("Request timeout")
         except requests.exceptions.ConnectionError:
@@ -193,18 +366,18 @@ class OverseerrBackend(MediaBackend):
         url = f"{self.base_url}/{endpoint}"
 
         try:
-            resp = self.session.get(url, headers=self.get_headers(), timeout=self.timeout)
+            resp = self.session.get(url, timeout=self.details_timeout)
 
             if resp.status_code == 404:
                 logger.warning(f"Media details not found: {media_type} {media_id}")
                 return None
 
-            if resp.status_code in [401, 403]:
+            if resp.status_code in _AUTH_FAILED:
                 logger.warning(f"Auth failed fetching details for {media_type} {media_id}")
                 return None
 
             resp.raise_for_status()
-            details = resp.json()
+            details = _json(resp)
 
             # Extract cast from credits
             credits = details.get('credits', {})
@@ -238,34 +411,35 @@ class OverseerrBackend(MediaBackend):
         return None
 
     def normalize_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
-        """Normalize Overseerr result with media status information"""
-        from overseerr import normalize_release_date, parse_date
+        """
+        Normalize Overseerr result with media status information.
 
-        rcopy = dict(result)
-        rcopy["_releaseDate"] = normalize_release_date(rcopy)
-        rcopy["_date"] = parse_date(rcopy.get("_releaseDate"))
-        rcopy["_title"] = rcopy.get("title") or rcopy.get("name") or ""
-        rcopy["_mediaType"] = rcopy.get("mediaType") or rcopy.get("type")
+        Annotates the freshly decoded response dict in place and returns it.
+        """
+        result["_releaseDate"] = release_date = normalize_release_date(result)
+        result["_date"] = parse_date(release_date)
+        result["_title"] = result.get("title") or result.get("name") or ""
+        result["_mediaType"] = media_type = result.get("mediaType") or result.get("type")
 
         # Extract media availability status
-        # 1=UNKNOWN, 2=PENDING, 3=PROCESSING, 4=PARTIALLY_AVAILABLE, 5=AVAILABLE, 6=DELETED
-        media_info = rcopy.get("mediaInfo", {})
-        status = media_info.get("status", 1)  # Default to UNKNOWN
-
-        rcopy["_mediaStatus"] = status
-        rcopy["_isAvailable"] = status == 5  # AVAILABLE
-        rcopy["_isPartiallyAvailable"] = status == 4  # PARTIALLY_AVAILABLE
-        rcopy["_isPending"] = status == 2  # PENDING (requested but not approved)
-        rcopy["_isProcessing"] = status == 3  # PROCESSING (downloading)
-        rcopy["_hasRequests"] = len(media_info.get("requests", [])) > 0
+        media_info = result.get("mediaInfo") or {}
+        status = media_info.get("status", _STATUS_UNKNOWN)
+        status_text, available, partially_available, pending, processing = \
+            _STATUS_FIELDS.get(status, _OTHER_STATUS_FIELDS)
+
+        result["_mediaStatus"] = status
+        result["_isAvailable"] = available
+        result["_isPartiallyAvailable"] = partially_available
+        result["_isPending"] = pending  # Requested but not approved
+        result["_isProcessing"] = processing  # Downloading
+        result["_hasRequests"] = bool(media_info.get("requests"))
 
         # For TV shows, extract available episode counts if partially available
-        if rcopy.get("_mediaType") == "tv" and status == 4:
+        if media_type == "tv" and partially_available:
             # Count available episodes from seasons data in mediaInfo
-            seasons = media_info.get("seasons", [])
             available_episodes = 0
             total_episodes = 0
-            for season in seasons:
+            for season in media_info.get("seasons", []):
                 # Skip season 0 (specials)
                 if season.get("seasonNumber", 0) == 0:
                     continue
@@ -273,21 +447,13 @@ class OverseerrBackend(MediaBackend):
                 available_episodes += season.get("episodeFileCount", 0)
                 total_episodes += season.get("episodeCount", 0)
 
-            rcopy["_availableEpisodes"] = available_episodes if available_episodes > 0 else None
-            rcopy["_totalEpisodes"] = total_episodes if total_episodes > 0 else None
+            result["_availableEpisodes"] = available_episodes if available_episodes > 0 else None
+            result["_totalEpisodes"] = total_episodes if total_episodes > 0 else None
 
         # Human-readable status
-        status_map = {
-            1: "unknown",
-            2: "pending",
-            3: "processing",
-            4: "partially_available",
-            5: "available",
-            6: "deleted"
-        }
-        rcopy["_statusText"] = status_map.get(status, "unknown")
+        result["_statusText"] = status_text
 
-        return rcopy
+        return result
 
 
 class JellyseerrBackend(OverseerrBackend):
@@ -324,39 +490,37 @@ class OmbiBackend(MediaBackend):
 
         Ombi has separate endpoints for movies and TV shows.
         """
-        results = []
-
+        searches = []
         # Search movies if not specifically looking for TV
         if media_type != 'tv':
-            try:
-                movie_results = self._search_movies(query)
-                results.extend(movie_results)
-            except Exception as e:
-                logger.error(f"Ombi movie search failed: {e}")
-
+            searches.append(('movie', self._search_movies))
         # Search TV if not specifically looking for movies
         if media_type != 'movie':
+            searches.append(('TV', self._search_tv))
+
+        # Both endpoints are independent; run them side by side so the wait is
+        # the slower RTT rather than the sum. Results stay movies first.
+        futures = [(label, io_executor.submit(fn, query)) for label, fn in searches]
+
+        results = []
+        for label, future in futures:
             try:
-                tv_results = self._search_tv(query)
-                results.extend(tv_results)
+                results.extend(future.result())
             except Exception as e:
-                logger.error(f"Ombi TV search failed: {e}")
+                logger.error(f"Ombi {label} search failed: {e}")
 
         logger.info(f"Ombi search: {len(results)} results for '{query}'")
         return results
 
     def _search_movies(self, query: str) -> List[Dict[str, Any]]:
         """Search Ombi for movies"""
-        url = f"{self.base_url}/api/v1/Search/movie/{query}"
+        url = f"{self.base_url}/api/v1/Search/movie/{_quote_query(query)}"
 
         try:
-            resp = self.session.get(url, headers=self.get_headers(), timeout=self.timeout)
-
-            if resp.status_code in [401, 403]:
-                raise MediaBackendAuthError("Invalid API key")
+            resp = self.session.get(url, timeout=self.timeout)
 
-            resp.raise_for_status()
-            results = resp.json() or []
+            _check_response(resp)
+            results = _json(resp) or []
 
             return [self.normalize_result(r, 'movie') for r in results]
 
@@ -367,16 +531,13 @@ class OmbiBackend(MediaBackend):
 
     def _search_tv(self, query: str) -> List[Dict[str, Any]]:
         """Search Ombi for TV shows"""
-        url = f"{self.base_url}/api/v1/Search/tv/{query}"
+        url = f"{self.base_url}/api/v1/Search/tv/{_quote_query(query)}"
 
         try:
-            resp = self.session.get(url, headers=self.get_headers(), timeout=self.timeout)
+            resp = self.session.get(url, timeout=self.timeout)
 
-            if resp.status_code in [401, 403]:
-                raise MediaBackendAuthError("Invalid API key")
-
-            resp.raise_for_status()
-            results = resp.json() or []
+            _check_response(resp)
+            results = _json(resp) or []
 
             return [self.normalize_result(r, 'tv') for r in results]
 
@@ -400,17 +561,16 @@ class OmbiBackend(MediaBackend):
         }
 
         try:
-            resp = self.session.post(url, json=payload, headers=self.get_headers(), timeout=self.timeout)
+            resp = self.session.post(url, json=payload, timeout=self.request_timeout)
 
-            if resp.status_code in [401, 403]:
-                raise MediaBackendAuthError("Invalid API key")
-
-            resp.raise_for_status()
-            result = resp.json()
+            _check_response(resp)
+            result = _json(resp)
 
             logger.info(f"Ombi movie request: {media_id}")
             return result
 
+        except requests.exceptions.ReadTimeout:
+            return self._unconfirmed_request(media_id, 'movie')
         except requests.exceptions.Timeout:
             raise MediaBackendConnectionError("Request timeout")
         except requests.exceptions.ConnectionError:
@@ -423,12 +583,13 @@ class OmbiBackend(MediaBackend):
         # Ombi requires more details for TV requests
         # We need to fetch the show details first
         show_url = f"{self.base_url}/api/v1/Search/tv/moviedb/{media_id}"
+        submitted = False
 
         try:
             # Get show details
-            show_resp = self.session.get(show_url, headers=self.get_headers(), timeout=self.timeout)
+            show_resp = self.session.get(show_url, timeout=self.timeout)
             show_resp.raise_for_status()
-            show_data = show_resp.json()
+            show_data = _json(show_resp)
 
             # Build request payload
             payload = {
@@ -446,17 +607,19 @@ class OmbiBackend(MediaBackend):
                 }]
 
             # Submit request
-            resp = self.session.post(url, json=payload, headers=self.get_headers(), timeout=self.timeout)
-
-            if resp.status_code in [401, 403]:
-                raise MediaBackendAuthError("Invalid API key")
+            submitted = True
+            resp = self.session.post(url, json=payload, timeout=self.request_timeout)
 
-            resp.raise_for_status()
-            result = resp.json()
+            _check_response(resp)
+            result = _json(resp)
 
             logger.info(f"Ombi TV request: {media_id}, season: {season}")
             return result
 
+        except requests.exceptions.ReadTimeout:
+            if submitted:
+                return self._unconfirmed_request(media_id, 'tv')
+            raise MediaBackendConnectionError("Request timeout")
         except requests.exceptions.Timeout:
             raise MediaBackendConnectionError("Request timeout")
         except requests.exceptions.ConnectionError:
@@ -478,8 +641,6 @@ class OmbiBackend(MediaBackend):
 
         Ombi uses different field names, so we need to map them.
         """
-        from overseerr import parse_date
-
         # Ombi uses different field names
         normalized = {
             "id": result.get("id") or result.get("theMovieDbId"),
@@ -531,48 +692,105 @@ class OmbiBackend(MediaBackend):
         return normalized
 
 
+# Successful detections per (base_url, api_key); the fallback default isn't
+# stored, so an unreachable backend is probed again next time
+_DETECTED_TYPES: Dict[Tuple[str, str], BackendType] = {}
+
+# Detections persisted across restarts, keyed by a hash of the backend URL
+_DETECTED_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend_type.cache.json')
+_DETECTED_FRESH_FOR = 24 * 3600
+
+
+def _load_detected_type(base_url: str) -> Optional[BackendType]:
+    """Backend type detected for this URL within the last day, from disk (best effort)"""
+    try:
+        with open(_DETECTED_CACHE_FILE, 'rb') as f:
+            entry = json.loads(f.read()).get(_url_key(base_url))
+        if entry and time.time() - entry['detected_at'] < _DETECTED_FRESH_FOR:
+            return BackendType(entry['type'])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+    return None
+
+
+def _save_detected_type(base_url: str, backend_type: BackendType) -> None:
+    """Persist a detected backend type (best effort; the directory may be read-only)"""
+    try:
+        with open(_DETECTED_CACHE_FILE, 'w') as f:
+            json.dump({_url_key(base_url): {'type': backend_type.value, 'detected_at': time.time()}}, f)
+    except OSError as e:
+        logger.debug(f"Could not persist detected backend type: {e}")
+
+
+def _url_key(base_url: str) -> str:
+    """Cache key for a backend URL; avoids writing the URL itself to disk"""
+    return hashlib.sha256(base_url.encode()).hexdigest()
+
+
 class BackendFactory:
     """Factory for creating media backend instances"""
 
     @staticmethod
-    def detect_backend_type(base_url: str, api_key: str) -> BackendType:
+    def detect_backend_type(base_url: str, api_key: str,
+                            session: Optional[requests.Session] = None) -> BackendType:
         """
         Auto-detect backend type by checking API endpoints.
 
+        Args:
+            session: Session to probe with (a shared keep-alive session if None)
+
         Returns:
             BackendType enum value
         """
-        # Try Overseerr/Jellyseerr API (they use the same endpoints)
-        try:
-            headers = {"X-Api-Key": api_key}
-            resp = requests.get(f"{base_url}/api/v1/status", headers=headers, timeout=5)
+        detected = _DETECTED_TYPES.get((base_url, api_key))
+        if detected is None:
+            detected = _load_detected_type(base_url)
+        if detected is not None:
+            _DETECTED_TYPES[(base_url, api_key)] = detected
+            return detected
+
+        session = session or _PROBE_SESSION
+
+        # Probe both APIs at once so an unreachable Overseerr endpoint doesn't
+        # delay the Ombi check by its full timeout; Overseerr wins if both answer
+        overseerr = io_executor.submit(BackendFactory._probe_overseerr, session, base_url, api_key)
+        ombi = io_executor.submit(BackendFactory._probe_ombi, session, base_url, api_key)
+
+        detected = overseerr.result() or ombi.result()
+        if detected is not None:
+            logger.info(f"Detected {detected.value.title()} backend")
+            _DETECTED_TYPES[(base_url, api_key)] = detected
+            _save_detected_type(base_url, detected)
+            return detected
+
+        # Default to Overseerr (most common)
+        logger.warning("Could not detect backend type, defaulting to Overseerr")
+        return BackendType.OVERSEERR
 
+    @staticmethod
+    def _probe_overseerr(session: requests.Session, base_url: str, api_key: str) -> Optional[BackendType]:
+        """Try the Overseerr/Jellyseerr status API (they use the same endpoints)"""
+        try:
+            resp = session.get(f"{base_url}/api/v1/status", headers={"X-Api-Key": api_key}, timeout=5)
             if resp.ok:
-                data = resp.json()
                 # Check if it's Jellyseerr
-                if "jellyseerr" in data.get("version", "").lower():
-                    logger.info("Detected Jellyseerr backend")
+                if "jellyseerr" in _json(resp).get("version", "").lower():
                     return BackendType.JELLYSEERR
-                else:
-                    logger.info("Detected Overseerr backend")
-                    return BackendType.OVERSEERR
-        except:
+                return BackendType.OVERSEERR
+        except Exception:
             pass
+        return None
 
-        # Try Ombi API
+    @staticmethod
+    def _probe_ombi(session: requests.Session, base_url: str, api_key: str) -> Optional[BackendType]:
+        """Try the Ombi status API"""
         try:
-            headers = {"ApiKey": api_key}
-            resp = requests.get(f"{base_url}/api/v1/Status", headers=headers, timeout=5)
-
+            resp = session.get(f"{base_url}/api/v1/Status", headers={"ApiKey": api_key}, timeout=5)
             if resp.ok:
-                logger.info("Detected Ombi backend")
                 return BackendType.OMBI
-        except:
+        except Exception:
             pass
-
-        # Default to Overseerr (most common)
-        logger.warning("Could not detect backend type, defaulting to Overseerr")
-        return BackendType.OVERSEERR
+        return None
 
     @staticmethod
     def create(backend_type: Optional[BackendType] = None, base_url: Optional[str] = None, api_key: Optional[str] = None) -> MediaBackend:
@@ -8,7 +8,7 @@ created_at and updated_at columns.
 import os
 import sys
 import datetime as dt
-from sqlalchemy import create_engine, text, inspect
+from sqlalchemy import create_engine, text, inspect, MetaData, Table, Index
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -135,6 +135,116 @@ def migrate():
             return False
 
 
+def migrate_unique_session_key():
+    """Make (user_id, conversation_id) unique so state saves can use a single upsert"""
+    print("\n🔄 Checking unique index on (user_id, conversation_id)...")
+
+    engine = create_engine(DATABASE_URL)
+    inspector = inspect(engine)
+    key = {'user_id', 'conversation_id'}
+
+    for idx in inspector.get_indexes('session_state'):
+        if idx.get('unique') and set(idx['column_names']) == key:
+            print("✅ Unique index already present")
+            return True
+
+    table = Table('session_state', MetaData(), autoload_with=engine)
+
+    with engine.connect() as conn:
+        try:
+            # Drop the old non-unique composite index so the name can be reused
+            for idx in list(table.indexes):
+                if {c.name for c in idx.columns} == key:
+                    print(f"   Dropping non-unique index {idx.name}")
+                    idx.drop(conn)
+
+            # Keep only the newest row per conversation
+            result = conn.execute(text("""
+                DELETE FROM session_state
+                WHERE id NOT IN (
+                    SELECT keep_id FROM (
+                        SELECT MAX(id) AS keep_id
+                        FROM session_state
+                        GROUP BY user_id, conversation_id
+                    ) AS newest
+                )
+            """))
+            if result.rowcount:
+                print(f"   Removed {result.rowcount} duplicate session rows")
+
+            Index('ix_session_user_conv', table.c.user_id, table.c.conversation_id, unique=True).create(conn)
+            conn.commit()
+
+            print("✅ Created unique index ix_session_user_conv")
+            return True
+
+        except Exception as e:
+            print(f"❌ Unique index migration failed: {e}")
+            conn.rollback()
+            return False
+
+
+def migrate_updated_index():
+    """Index updated_at for session expiry and dashboard queries"""
+    print("\n🔄 Checking index on updated_at...")
+
+    engine = create_engine(DATABASE_URL)
+    for idx in inspect(engine).get_indexes('session_state'):
+        if idx['column_names'] == ['updated_at']:
+            print("✅ updated_at index already present")
+            return True
+
+    table = Table('session_state', MetaData(), autoload_with=engine)
+    with engine.connect() as conn:
+        try:
+            Index('ix_session_updated', table.c.updated_at).create(conn)
+            conn.commit()
+            print("✅ Created index ix_session_updated")
+            return True
+        except Exception as e:
+            print(f"❌ updated_at index migration failed: {e}")
+            conn.rollback()
+            return False
+
+
+def migrate_state_blob():
+    """Switch state_json from TEXT to a binary column for zstd-compressed state"""
+    print("\n🔄 Checking state_json column type...")
+
+    engine = create_engine(DATABASE_URL)
+    dialect = engine.dialect.name
+
+    # SQLite never converts BLOB values, whatever the declared column type
+    if dialect == 'sqlite':
+        print("✅ SQLite stores compressed state as-is - nothing to change")
+        return True
+
+    columns = {col['name']: col for col in inspect(engine).get_columns('session_state')}
+    if columns['state_json']['type'].python_type is bytes:
+        print("✅ state_json is already a binary column")
+        return True
+
+    # Existing plain JSON rows are kept; the app reads both formats
+    statements = {
+        'postgresql': "ALTER TABLE session_state ALTER COLUMN state_json TYPE BYTEA USING convert_to(state_json, 'UTF8')",
+        'mysql': "ALTER TABLE session_state MODIFY state_json LONGBLOB NOT NULL",
+    }
+    if dialect not in statements:
+        print(f"❌ Don't know how to convert state_json on {dialect}")
+        return False
+
+    with engine.connect() as conn:
+        try:
+            conn.execute(text(statements[dialect]))
+            conn.commit()
+            print("✅ Converted state_json to a binary column")
+            return True
+        except Exception as e:
+            print(f"❌ state_json conversion failed: {e}")
+            conn.rollback()
+            return False
+
+
 def verify_migration():
     """Verify that the migration was successful"""
     print("\n🔍 Verifying migration...")
@@ -175,7 +285,12 @@ if __name__ == "__main__":
     print("  Alexa Overseerr Database Migration")
     print("=" * 60)
 
-    success = migrate()
+    # Fresh install: the app creates the current schema on first start
+    if not inspect(create_engine(DATABASE_URL)).has_table('session_state'):
+        print("ℹ️  No session_state table yet - nothing to migrate")
+        sys.exit(0)
+
+    success = migrate() and migrate_unique_session_key() and migrate_updated_index() and migrate_state_blob()
 
     if success:
         verify_migration()
@@ -1,15 +1,17 @@
 import os
 import datetime as dt
 import time
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-import requests
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
+from cachetools import TTLCache
 
 from config import Config
 from logger import logger, log_error, log_overseerr_call
-from media_backends import get_backend, MediaBackendError, MediaBackendConnectionError, MediaBackendAuthError
+from media_backends import get_backend, io_executor, MediaBackendError, MediaBackendConnectionError, MediaBackendAuthError
+# Date helpers live with the backends; re-exported for existing callers
+from media_backends import normalize_release_date, parse_date
 
 # Use configuration instead of direct env vars
 BASE = Config.MEDIA_BACKEND_URL.rstrip("/")
@@ -25,38 +27,43 @@ HEADERS = {
 # Request timeout settings (connect timeout, read timeout)
 TIMEOUT = (5, 30)
 
-# Configure retry strategy
-retry_strategy = Retry(
-    total=3,
-    backoff_factor=1,  # Wait 1s, 2s, 4s between retries
-    status_forcelist=[429, 500, 502, 503, 504],
-    allowed_methods=["HEAD", "GET", "OPTIONS", "POST"]
-)
-
-# Create session with retry adapter
-session = requests.Session()
-adapter = HTTPAdapter(max_retries=retry_strategy)
-session.mount("http://", adapter)
-session.mount("https://", adapter)
-
 # Get backend instance (auto-detects Overseerr/Jellyseerr/Ombi)
 _backend = get_backend()
 
-# Helper: normalize release date for movie/tv
+# Recent search responses keyed by (normalized query, media_type). Repeat
+# searches within the TTL skip the backend round trip entirely. Cleared
+# whenever a request is created so availability flags don't go stale.
+_SEARCH_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=600)
+_SEARCH_CACHE_LOCK = threading.Lock()
 
-def normalize_release_date(item: Dict[str, Any]) -> Optional[str]:
-    # Overseerr returns either releaseDate (movies) or firstAirDate (tv)
-    date = item.get("releaseDate") or item.get("firstAirDate")
-    return date
 
+def _search_cache_key(query: str, media_type: Optional[str]) -> Tuple[str, Optional[str]]:
+    """Normalize case and whitespace so near-identical utterances share an entry"""
+    return ' '.join(query.split()).casefold(), media_type
 
-def parse_date(date_str: Optional[str]) -> Optional[dt.date]:
-    if not date_str:
-        return None
-    try:
-        return dt.date.fromisoformat(date_str[:10])
-    except Exception:
-        return None
+
+def clear_search_cache() -> None:
+    """Drop all cached search responses (after requests or config changes)"""
+    with _SEARCH_CACHE_LOCK:
+        _SEARCH_CACHE.clear()
+
+
+# Cast/director/genres per (media_type, media_id). Credits rarely change, so
+# entries live for an hour; only the small normalized dict is kept.
+_DETAILS_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=3600)
+# Reentrant: a lookup that already finished runs its done-callback inline
+_DETAILS_CACHE_LOCK = threading.RLock()
+# Lookups still running, so a read-out waits on them instead of refetching
+_DETAILS_IN_FLIGHT: Dict[Tuple[str, int], Future] = {}
+# Longest a read-out waits for details before going without cast names; the
+# lookup carries on and caches its answer for the next turn
+_DETAILS_WAIT = 1.5
+
+
+def clear_details_cache() -> None:
+    """Drop all cached media details (after config changes)"""
+    with _DETAILS_CACHE_LOCK:
+        _DETAILS_CACHE.clear()
 
 
 class OverseerrError(MediaBackendError):
@@ -132,12 +139,22 @@ def search(query: str, media_type: Optional[str] = None) -> List[Dict[str, Any]]
         log_overseerr_call("search", True, query=query, media_type=media_type, result_count=len(candidates))
         return candidates
 
+    cache_key = _search_cache_key(query, media_type)
+    with _SEARCH_CACHE_LOCK:
+        cached = _SEARCH_CACHE.get(cache_key)
+    if cached is not None:
+        logger.debug(f"Search cache hit: query='{query}', media_type={media_type}")
+        # Callers annotate results in place, so hand out copies
+        return [dict(r) for r in cached]
+
     # Use the backend abstraction
     try:
         logger.debug(f"Searching backend: query='{query}', media_type={media_type}")
         results = _backend.search(query, media_type)
 
         log_overseerr_call("search", True, query=query, media_type=media_type, result_count=len(results))
+        with _SEARCH_CACHE_LOCK:
+            _SEARCH_CACHE[cache_key] = [dict(r) for r in results]
         return results
 
     except MediaBackendAuthError as e:
@@ -208,17 +225,68 @@ def get_media_details(media_id: int, media_type: str) -> Optional[Dict[str, Any]
     Returns:
         Dict with 'cast' (list of names), 'director' (str), 'genres' (list), or None if unavailable
     """
+    cache_key = (media_type, media_id)
+    with _DETAILS_CACHE_LOCK:
+        cached = _DETAILS_CACHE.get(cache_key)
+        future = None if cached is not None else _details_future(cache_key)
+    if cached is not None:
+        logger.debug("Details cache hit: %s %s", media_type, media_id)
+        return dict(cached)
+
+    # Shares a prefetch already fetching this item rather than sending the
+    # same request again, and never holds the voice turn past _DETAILS_WAIT
+    try:
+        details = future.result(timeout=_DETAILS_WAIT)
+    except Exception:
+        logger.debug("Details for %s %s not ready in time", media_type, media_id)
+        return None
+    return dict(details) if details else details
+
+
+def _fetch_media_details(media_id: int, media_type: str) -> Optional[Dict[str, Any]]:
+    """Fetch details from the backend and cache a successful answer"""
     try:
         logger.debug(f"Fetching details for {media_type} {media_id}")
         details = _backend.get_details(media_id, media_type)
         if details:
             logger.info(f"Got details for {media_type} {media_id}: {len(details.get('cast', []))} cast members")
+            # Failed lookups return None and are retried next time
+            with _DETAILS_CACHE_LOCK:
+                _DETAILS_CACHE[(media_type, media_id)] = dict(details)
         return details
     except Exception as e:
         logger.warning(f"Failed to fetch details for {media_type} {media_id}: {e}")
         return None
 
 
+def _forget_details_fetch(cache_key: Tuple[str, int], future: Future) -> None:
+    with _DETAILS_CACHE_LOCK:
+        if _DETAILS_IN_FLIGHT.get(cache_key) is future:
+            del _DETAILS_IN_FLIGHT[cache_key]
+
+
+def _details_future(cache_key: Tuple[str, int]) -> Future:
+    """In-flight lookup for an item, starting one if needed (caller holds _DETAILS_CACHE_LOCK)"""
+    future = _DETAILS_IN_FLIGHT.get(cache_key)
+    if future is None:
+        media_type, media_id = cache_key
+        future = io_executor.submit(_fetch_media_details, media_id, media_type)
+        _DETAILS_IN_FLIGHT[cache_key] = future
+        future.add_done_callback(lambda f, key=cache_key: _forget_details_fetch(key, f))
+    return future
+
+
+def prefetch_media_details(items: Iterable[Tuple[int, str]]) -> None:
+    """Warm the details cache in the background for items likely to be read out next"""
+    if MOCK:
+        return
+    for media_id, media_type in dict.fromkeys(items):
+        cache_key = (media_type, media_id)
+        with _DETAILS_CACHE_LOCK:
+            if cache_key not in _DETAILS_CACHE:
+                _details_future(cache_key)
+
+
 def request_media(media_id: int, media_type: str, season: Optional[int] = None) -> Dict[str, Any]:
     """
     Create a media request using the configured backend (Overseerr/Jellyseerr/Ombi).
@@ -255,6 +323,7 @@ def request_media(media_id: int, media_type: str, season: Optional[int] = None)
         result = _backend.request_media(media_id, media_type, season)
 
         log_overseerr_call("request_media", True, media_id=media_id, media_type=media_type, season=season)
+        clear_search_cache()
         return result
 
     except MediaBackendAuthError as e:
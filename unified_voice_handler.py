@@ -5,27 +5,152 @@ This module contains platform-agnostic business logic for handling voice request
 """
 import re
 import json
+import random
 import datetime
-from typing import Optional, Dict, Any, List
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Optional, Dict, Any, List, Tuple, Union
+
+from rapidfuzz import fuzz
+from sqlalchemy import case, insert, select, update
 
 from voice_assistant_adapter import VoiceRequest, VoiceResponse, VoiceAssistantPlatform
 from logger import logger, log_request, log_error
 import overseerr
 from overseerr import OverseerrError, OverseerrConnectionError, OverseerrAuthError
-from db import db_session, SessionState
+from db import db_session, engine, SessionState, STATE_AS_TEXT, UPSERT_SUPPORTED, upsert_session_state
 from enhanced_search import search_enhancer
 
 
 # ==========================================
-# JSON Encoder for Date Objects
+# State Serialization
+# ==========================================
+
+# orjson serializes date/datetime natively (ISO 8601, same as isoformat());
+# the stdlib path is only kept for installs without it.
+try:
+    import orjson
+
+    def _dumps_state(state: Dict[str, Any]) -> bytes:
+        return orjson.dumps(state)
+
+    _loads_state = orjson.loads
+except ImportError:
+    def _dumps_state(state: Dict[str, Any]) -> bytes:
+        return json.dumps(state, default=lambda obj: obj.isoformat()).encode()
+
+    _loads_state = json.loads
+
+# State is stored as zstd-compressed JSON (level 1: fast, still several times
+# smaller). Rows written before compression, or by installs without zstandard,
+# hold plain JSON and are told apart by the zstd frame magic number.
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+try:
+    import zstandard
+
+    # zstandard contexts must not be shared between threads
+    _zstd_local = threading.local()
+
+    def _compress(data: bytes) -> bytes:
+        cctx = getattr(_zstd_local, 'cctx', None)
+        if cctx is None:
+            cctx = _zstd_local.cctx = zstandard.ZstdCompressor(level=1)
+        return cctx.compress(data)
+
+    def _decompress(data: bytes) -> bytes:
+        dctx = getattr(_zstd_local, 'dctx', None)
+        if dctx is None:
+            dctx = _zstd_local.dctx = zstandard.ZstdDecompressor()
+        try:
+            return dctx.decompress(data)
+        except zstandard.ZstdError as e:
+            raise json.JSONDecodeError(f"corrupt zstd frame: {e}", '', 0)
+except ImportError:
+    def _compress(data: bytes) -> bytes:
+        return data
+
+    def _decompress(data: bytes) -> bytes:
+        raise json.JSONDecodeError("zstd-compressed state but zstandard is not installed", '', 0)
+
+
+def encode_state(state: Dict[str, Any]) -> Union[bytes, str]:
+    """Serialize state for the state_json column (plain JSON text if it isn't migrated yet)"""
+    if STATE_AS_TEXT:
+        return _dumps_state(state).decode('utf-8')
+    return _compress(_dumps_state(state))
+
+
+def decode_state(payload: Any) -> Dict[str, Any]:
+    """
+    Parse a state_json value, compressed or not.
+
+    Raises json.JSONDecodeError if the payload is corrupt.
+    """
+    if isinstance(payload, str):
+        # Legacy TEXT rows
+        return _loads_state(payload)
+    if payload[:4] == _ZSTD_MAGIC:
+        payload = _decompress(payload)
+    return _loads_state(payload)
+
+
+# ==========================================
+# Precompiled Patterns
 # ==========================================
 
-class DateTimeEncoder(json.JSONEncoder):
-    """Custom JSON encoder that handles date and datetime objects"""
-    def default(self, obj):
-        if isinstance(obj, (datetime.date, datetime.datetime)):
-            return obj.isoformat()
-        return super().default(obj)
+_THIS_YEAR_RE = re.compile(r'\bthis year\b')
+_LAST_YEAR_RE = re.compile(r'\blast year\b')
+_COUPLE_YEARS_RE = re.compile(r'\ba couple (?:of )?years ago\b')
+_FEW_YEARS_RE = re.compile(r'\ba few years ago\b')
+_NOUGHTIES_RE = re.compile(r'\b(?:noughties|naughties)\b')
+_FULL_YEAR_RE = re.compile(r'\b(1[89]\d{2}|20\d{2})s?\b')
+_SHORT_DECADE_RE = re.compile(r'\b(?:the )?([0-9]{2})(?:s|\'s)\b')
+
+_UPCOMING_RE = re.compile(r"\bupcoming\b", re.IGNORECASE)
+_UPCOMING_TRUE = frozenset({'yes', 'true', '1', 'upcoming'})
+_YEAR_RE = re.compile(r"(\d{4})")
+_DIGITS_RE = re.compile(r"(\d+)")
+
+# Media type keywords -> (media_type, user_term). Matched as substrings so
+# plurals like "movies" or "shows" still count.
+# When several appear, the lowest priority wins regardless of position:
+# any TV keyword beats a movie keyword ("movie version of the tv show X" is tv)
+_MEDIA_TYPE_RE = re.compile(r"tv|show|series|film|movie", re.IGNORECASE)
+_MEDIA_TYPE_TERMS = {
+    'tv': (0, ('tv', 'TV show')),
+    'show': (1, ('tv', 'show')),
+    'series': (1, ('tv', 'show')),
+    'film': (2, ('movie', 'film')),
+    'movie': (3, ('movie', 'movie')),
+}
+
+
+# ==========================================
+# Speech Templates
+# ==========================================
+
+# Results after the one being read out whose cast details are fetched ahead
+_DETAILS_PREFETCH = 2
+
+_CAST_TWO_TMPL = ", with %s and %s"
+_CAST_ONE_TMPL = ", starring %s"
+
+_RELEASED_DATE_TMPLS = ("from %s", "released in %s", "released %s", "that came out in %s")
+_UNRELEASED_DATE_TMPLS = ("releasing in %s", "that's releasing in %s", "coming out in %s", "premiering in %s")
+_COIN = (True, False)
+
+# (template, capitalize title part) for "No" turns, indexed by attempt
+_NEXT_OPENER_TMPLS = (
+    ("What about %s", False),
+    ("How about %s", False),
+    ("This one? %s", True),
+    ("What about this one? %s", True),
+    ("Have I got it right this time? %s", True),
+    ("Did I nail it? %s", True),
+)
 
 
 # ==========================================
@@ -34,7 +159,6 @@ class DateTimeEncoder(json.JSONEncoder):
 
 def get_varied_ok() -> str:
     """Get a varied 'OK' response to sound more natural"""
-    import random
     responses = [
         "Alright",
         "Okey dokey",
@@ -70,27 +194,27 @@ def parse_year_filter(text: Optional[str]) -> Optional[tuple[int, int]]:
     current_year = datetime.datetime.now().year
 
     # Check for "this year" (with 1 year buffer for mistakes)
-    if re.search(r'\bthis year\b', text_lower):
+    if _THIS_YEAR_RE.search(text_lower):
         return (current_year - 1, current_year)
 
     # Check for "last year" (with 1 year buffer)
-    if re.search(r'\blast year\b', text_lower):
+    if _LAST_YEAR_RE.search(text_lower):
         return (current_year - 2, current_year - 1)
 
     # Check for "a couple of years ago" (5 year range)
-    if re.search(r'\ba couple (?:of )?years ago\b', text_lower):
+    if _COUPLE_YEARS_RE.search(text_lower):
         return (current_year - 5, current_year - 1)
 
     # Check for "a few years ago" (10 year range)
-    if re.search(r'\ba few years ago\b', text_lower):
+    if _FEW_YEARS_RE.search(text_lower):
         return (current_year - 10, current_year - 1)
 
     # Check for "noughties" or "naughties" (2000-2009)
-    if re.search(r'\b(?:noughties|naughties)\b', text_lower):
+    if _NOUGHTIES_RE.search(text_lower):
         return (2000, 2009)
 
     # Check for 4-digit year (e.g., "1978", "in the 1970s")
-    match = re.search(r'\b(1[89]\d{2}|20\d{2})s?\b', text_lower)
+    match = _FULL_YEAR_RE.search(text_lower)
     if match:
         year = int(match.group(1))
         # Check if it ends with '0' - likely a decade reference (e.g., "1970s")
@@ -101,7 +225,7 @@ def parse_year_filter(text: Optional[str]) -> Optional[tuple[int, int]]:
 
     # Check for 2-digit decade references (e.g., "in the 70s", "the 80's")
     # Assume 10s-20s are 21st century (2010s, 2020s), 30s+ are 20th century
-    match = re.search(r'\b(?:the )?([0-9]{2})(?:s|\'s)\b', text_lower)
+    match = _SHORT_DECADE_RE.search(text_lower)
     if match:
         decade = int(match.group(1))
         if decade <= 29:  # 00-29 are 2000-2029
@@ -135,6 +259,14 @@ def format_year_range_for_speech(year_range: tuple[int, int]) -> str:
     return f"{start_year} to {end_year}"
 
 
+@functools.lru_cache(maxsize=256)
+def _extract_year(year_str: str) -> Optional[int]:
+    """Pull the first four-digit number out of a Year slot value"""
+    m = _YEAR_RE.search(year_str)
+    return int(m.group(1)) if m else None
+
+
+@functools.lru_cache(maxsize=256)
 def media_type_from_text(text: Optional[str]) -> tuple[Optional[str], Optional[str]]:
     """
     Extract media type from spoken text and preserve user's terminology.
@@ -146,16 +278,10 @@ def media_type_from_text(text: Optional[str]) -> tuple[Optional[str], Optional[s
     """
     if not text:
         return None, None
-    t = text.lower()
-    if 'tv' in t:
-        return 'tv', 'TV show'
-    if 'show' in t or 'series' in t:
-        return 'tv', 'show'
-    if 'film' in t:
-        return 'movie', 'film'
-    if 'movie' in t:
-        return 'movie', 'movie'
-    return None, None
+    found = _MEDIA_TYPE_RE.findall(text)
+    if not found:
+        return None, None
+    return min(_MEDIA_TYPE_TERMS[k.lower()] for k in found)[1]
 
 
 def build_episode_availability_text(item: Dict[str, Any]) -> str:
@@ -184,9 +310,6 @@ def build_speech_for_item(item: Dict[str, Any], prefix: str = "I found", user_te
         user_term: User's preferred terminology (e.g., "film", "movie", "show")
         include_cast: Whether to fetch and include cast information (default True)
     """
-    from datetime import datetime
-    import random
-
     title = item.get('_title') or item.get('title') or item.get('name') or 'Unknown title'
     mtype = item.get('_mediaType') or 'title'
     year = None
@@ -197,8 +320,8 @@ def build_speech_for_item(item: Dict[str, Any], prefix: str = "I found", user_te
         year = release_date_str[:4]
         try:
             # Check if release date is in the future
-            release_date = datetime.fromisoformat(release_date_str.replace('Z', '+00:00'))
-            now = datetime.now(release_date.tzinfo) if release_date.tzinfo else datetime.now()
+            release_date = datetime.datetime.fromisoformat(release_date_str.replace('Z', '+00:00'))
+            now = datetime.datetime.now(release_date.tzinfo) if release_date.tzinfo else datetime.datetime.now()
             is_unreleased = release_date > now
         except (ValueError, AttributeError):
             pass
@@ -221,42 +344,30 @@ def build_speech_for_item(item: Dict[str, Any], prefix: str = "I found", user_te
                 cast_list = details['cast']
                 if len(cast_list) >= 2:
                     # Format: "with Actor1 and Actor2"
-                    cast_text = f", with {cast_list[0]} and {cast_list[1]}"
+                    cast_text = _CAST_TWO_TMPL % (cast_list[0], cast_list[1])
                 elif len(cast_list) == 1:
-                    cast_text = f", starring {cast_list[0]}"
+                    cast_text = _CAST_ONE_TMPL % cast_list[0]
 
     # Build base speech
     if year:
         if is_unreleased:
             # Varied phrasing for unreleased content
-            date_phrases = [
-                f"releasing in {year}",
-                f"that's releasing in {year}",
-                f"coming out in {year}",
-                f"premiering in {year}",
-            ]
-            date_part = random.choice(date_phrases)
-            speech = f"{prefix} the {type_word} {title}, {date_part}{cast_text}"
+            date_part = random.choice(_UNRELEASED_DATE_TMPLS) % year
+            speech = "%s the %s %s, %s%s" % (prefix, type_word, title, date_part, cast_text)
         else:
             # Varied date phrasing for released content
-            date_phrases = [
-                f"from {year}",
-                f"released in {year}",
-                f"released {year}",
-                f"that came out in {year}",
-            ]
-            date_part = random.choice(date_phrases)
+            date_part = random.choice(_RELEASED_DATE_TMPLS) % year
 
             # Vary structure: "the movie Superman from 1978" vs "a movie from 1978, Superman"
-            if random.choice([True, False]):
-                speech = f"{prefix} the {type_word} {title} {date_part}{cast_text}"
+            if random.choice(_COIN):
+                speech = "%s the %s %s %s%s" % (prefix, type_word, title, date_part, cast_text)
             else:
                 if "from" in date_part or "in" in date_part:
-                    speech = f"{prefix} a {type_word} {date_part}, {title}{cast_text}"
+                    speech = "%s a %s %s, %s%s" % (prefix, type_word, date_part, title, cast_text)
                 else:
-                    speech = f"{prefix} the {year} {type_word} {title}{cast_text}"
+                    speech = "%s the %s %s %s%s" % (prefix, year, type_word, title, cast_text)
     else:
-        speech = f"{prefix} the {type_word} {title}{cast_text}"
+        speech = "%s the %s %s%s" % (prefix, type_word, title, cast_text)
 
     # Add availability status and appropriate question
     # CONSISTENT LOGIC: Yes = "that's the one", No = "show me next"
@@ -279,6 +390,17 @@ def build_speech_for_item(item: Dict[str, Any], prefix: str = "I found", user_te
     return speech
 
 
+def prefetch_upcoming_details(results: List[Dict[str, Any]], start: int) -> None:
+    """Fetch cast details for the next results in the background, so 'no' answers quickly"""
+    items = [
+        (r['id'], r['_mediaType'])
+        for r in results[start:start + _DETAILS_PREFETCH]
+        if r.get('id') and r.get('_mediaType') in ('movie', 'tv')
+    ]
+    if items:
+        overseerr.prefetch_media_details(items)
+
+
 def build_speech_for_next(item: Dict[str, Any], user_term: Optional[str] = None, attempt: int = 0, include_cast: bool = True) -> str:
     """
     Generate speech for the next alternative result with varied phrasing.
@@ -289,8 +411,6 @@ def build_speech_for_next(item: Dict[str, Any], user_term: Optional[str] = None,
         attempt: Which attempt this is (0-based) for varying the phrasing
         include_cast: Whether to fetch and include cast information (default True)
     """
-    import random
-
     title = item.get('_title') or 'Unknown title'
     mtype = item.get('_mediaType') or 'title'
     year = None
@@ -314,52 +434,37 @@ def build_speech_for_next(item: Dict[str, Any], user_term: Optional[str] = None,
             if details and details.get('cast'):
                 cast_list = details['cast']
                 if len(cast_list) >= 2:
-                    cast_text = f", with {cast_list[0]} and {cast_list[1]}"
+                    cast_text = _CAST_TWO_TMPL % (cast_list[0], cast_list[1])
                 elif len(cast_list) == 1:
-                    cast_text = f", starring {cast_list[0]}"
+                    cast_text = _CAST_ONE_TMPL % cast_list[0]
 
     # Build the title part with year if available
     if year:
         # Varied date phrasing options
-        date_phrases = [
-            f"from {year}",
-            f"released in {year}",
-            f"released {year}",
-            f"that came out in {year}",
-        ]
-        date_part = random.choice(date_phrases)
+        date_part = random.choice(_RELEASED_DATE_TMPLS) % year
 
         # Also vary whether we say "the 1978 movie" or "movie from 1978"
-        if random.choice([True, False]):
+        if random.choice(_COIN):
             # "the movie Superman from 1978"
-            title_part = f"the {type_word} {title} {date_part}{cast_text}"
+            title_part = "the %s %s %s%s" % (type_word, title, date_part, cast_text)
         else:
             # "the 1978 movie Superman" or "a movie from 1978, Superman"
             if "from" in date_part or "in" in date_part:
                 # "a movie from 1978, Superman"
-                title_part = f"a {type_word} {date_part}, {title}{cast_text}"
+                title_part = "a %s %s, %s%s" % (type_word, date_part, title, cast_text)
             else:
                 # "the 1978 movie Superman"
-                title_part = f"the {year} {type_word} {title}{cast_text}"
+                title_part = "the %s %s %s%s" % (year, type_word, title, cast_text)
     else:
-        title_part = f"the {type_word} {title}{cast_text}"
+        title_part = "the %s %s%s" % (type_word, title, cast_text)
 
     # Varied opening phrases based on attempt number
-    # Use attempt % 6 to cycle through 6 different phrasings
-    phrases = [
-        f"What about {title_part}",
-        f"How about {title_part}",
-        f"This one? {title_part.capitalize()}",
-        f"What about this one? {title_part.capitalize()}",
-        f"Have I got it right this time? {title_part.capitalize()}",
-        f"Did I nail it? {title_part.capitalize()}",
-    ]
-
-    # Use modulo to cycle through, or random if attempt is too high
-    if attempt < len(phrases):
-        speech = phrases[attempt % len(phrases)]
+    # Cycle through them in order, or pick at random once attempts run past the end
+    if attempt < len(_NEXT_OPENER_TMPLS):
+        opener, capitalize = _NEXT_OPENER_TMPLS[attempt]
     else:
-        speech = random.choice(phrases)
+        opener, capitalize = random.choice(_NEXT_OPENER_TMPLS)
+    speech = opener % (title_part.capitalize() if capitalize else title_part)
 
     # Add availability status and question
     # CONSISTENT LOGIC: Yes = "that's the one", No = "show me next"
@@ -380,8 +485,6 @@ def build_speech_for_next(item: Dict[str, Any], user_term: Optional[str] = None,
 
 def build_availability_message(item: Dict[str, Any], season_number: Optional[int] = None) -> str:
     """Build message about when content will be available based on release date"""
-    from datetime import datetime
-
     release_date_str = item.get('_releaseDate')
 
     if not release_date_str:
@@ -390,8 +493,8 @@ def build_availability_message(item: Dict[str, Any], season_number: Optional[int
 
     try:
         # Parse the release date
-        release_date = datetime.fromisoformat(release_date_str.replace('Z', '+00:00'))
-        now = datetime.now(release_date.tzinfo) if release_date.tzinfo else datetime.now()
+        release_date = datetime.datetime.fromisoformat(release_date_str.replace('Z', '+00:00'))
+        now = datetime.datetime.now(release_date.tzinfo) if release_date.tzinfo else datetime.datetime.now()
 
         # Check if already released
         if release_date <= now:
@@ -421,48 +524,187 @@ def build_availability_message(item: Dict[str, Any], season_number: Optional[int
         return "It should be available soon."
 
 
+# ==========================================
+# Session State Store
+# ==========================================
+
+# In-process tier in front of the session_state table:
+# (user_id, conversation_id) -> (payload, updated_at). A cached payload is only
+# used while the row's updated_at still matches, so writes from other gunicorn
+# workers are always picked up. MySQL DATETIME drops microseconds, which makes
+# updated_at too coarse to act as a version there, so the cache stays off.
+_STATE_CACHE_SIZE = 512 if engine.dialect.name in {'sqlite', 'postgresql'} else 0
+_STATE_CACHE: "OrderedDict[Tuple[str, str], Tuple[bytes, datetime.datetime]]" = OrderedDict()
+_STATE_CACHE_LOCK = threading.Lock()
+
+# Download turns persist state off the response path. Pending futures are
+# tracked per conversation so the next load in this process waits for them.
+_WRITE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='state-writer')
+_PENDING_WRITES: Dict[Tuple[str, str], Future] = {}
+_PENDING_WRITES_LOCK = threading.Lock()
+_PENDING_WRITE_TIMEOUT = 5  # seconds
+
+
+def _cache_state(key: Tuple[str, str], payload: bytes, version: datetime.datetime) -> None:
+    """Store a payload in the in-process cache, evicting the least recently used entry"""
+    if not _STATE_CACHE_SIZE:
+        return
+    with _STATE_CACHE_LOCK:
+        _STATE_CACHE[key] = (payload, version)
+        _STATE_CACHE.move_to_end(key)
+        while len(_STATE_CACHE) > _STATE_CACHE_SIZE:
+            _STATE_CACHE.popitem(last=False)
+
+
+# Result fields the Yes/No handlers and speech builders read back from state.
+# Everything else the backend returns is dropped before persisting.
+_STATE_RESULT_KEYS = (
+    '_title', '_mediaType', '_releaseDate',
+    '_isAvailable', '_isPartiallyAvailable', '_isProcessing', '_isPending', '_availableEpisodes',
+    '_combined_score', '_match_tier',
+)
+_STATE_MAX_RESULTS = 10
+
+
+def slim_results(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Project ranked results down to what later turns need, capped at _STATE_MAX_RESULTS"""
+    slim = []
+    for r in results[:_STATE_MAX_RESULTS]:
+        item = {k: r[k] for k in _STATE_RESULT_KEYS if r.get(k) is not None}
+        # Resolve the backend ID once here so the Yes turn is a single lookup
+        item['id'] = r.get('id') or r.get('mediaId') or r.get('tmdbId')
+        slim.append(item)
+    return slim
+
+
+def _wait_for_pending_write(key: Tuple[str, str]) -> None:
+    """Block until a queued background write for this conversation has landed"""
+    with _PENDING_WRITES_LOCK:
+        pending = _PENDING_WRITES.get(key)
+    if pending is not None:
+        wait([pending], timeout=_PENDING_WRITE_TIMEOUT)
+
+
+def flush_pending_writes(timeout: float = _PENDING_WRITE_TIMEOUT) -> int:
+    """Wait for all queued background state writes; returns how many didn't finish in time"""
+    with _PENDING_WRITES_LOCK:
+        pending = list(_PENDING_WRITES.values())
+    if not pending:
+        return 0
+    _, not_done = wait(pending, timeout=timeout)
+    return len(not_done)
+
+
+def _forget_write(key: Tuple[str, str], future: Future) -> None:
+    with _PENDING_WRITES_LOCK:
+        if _PENDING_WRITES.get(key) is future:
+            del _PENDING_WRITES[key]
+
+
+def _write_after(previous: Optional[Future], user_id: str, conversation_id: str, state: Dict[str, Any]) -> None:
+    """Background task body: keep writes per conversation in submission order"""
+    if previous is not None:
+        wait([previous])
+    try:
+        _write_state(user_id, conversation_id, state)
+    except Exception as e:
+        log_error("Background session state write failed", e, user_id=user_id)
+
+
+def save_state_async(user_id: str, conversation_id: str, state: Dict[str, Any]) -> Future:
+    """
+    Queue a state write on the background pool and return immediately.
+
+    load_state/save_state in this process wait for the queued write first, so
+    the next turn always sees it. The caller must not mutate state afterwards.
+    """
+    key = (user_id, conversation_id)
+    with _PENDING_WRITES_LOCK:
+        future = _WRITE_POOL.submit(_write_after, _PENDING_WRITES.get(key), user_id, conversation_id, state)
+        _PENDING_WRITES[key] = future
+    future.add_done_callback(lambda f: _forget_write(key, f))
+    return future
+
+
 def save_state(user_id: str, conversation_id: str, state: Dict[str, Any]):
     """Save conversation state to database"""
+    _wait_for_pending_write((user_id, conversation_id))
+    _write_state(user_id, conversation_id, state)
+
+
+def _write_state(user_id: str, conversation_id: str, state: Dict[str, Any]):
+    """Serialize and persist state, then refresh the in-process cache"""
+    payload = encode_state(state)
+    now = datetime.datetime.utcnow()
     with db_session() as s:
-        existing = (
-            s.query(SessionState)
-            .filter(
-                SessionState.user_id == user_id,
-                SessionState.conversation_id == conversation_id
-            )
-            .one_or_none()
-        )
-        payload = json.dumps(state, cls=DateTimeEncoder)
-        if existing:
-            existing.state_json = payload
+        if UPSERT_SUPPORTED:
+            upsert_session_state(s, user_id, conversation_id, payload, now)
         else:
-            row = SessionState(
-                user_id=user_id,
-                conversation_id=conversation_id,
-                state_json=payload
+            # Column-level UPDATE first so the existing row is never hydrated
+            # into an ORM object; only insert when nothing matched.
+            updated = s.execute(
+                update(SessionState)
+                .where(
+                    SessionState.user_id == user_id,
+                    SessionState.conversation_id == conversation_id
+                )
+                .values(state_json=payload, updated_at=now)
             )
-            s.add(row)
+            if not updated.rowcount:
+                s.execute(
+                    insert(SessionState).values(
+                        user_id=user_id,
+                        conversation_id=conversation_id,
+                        state_json=payload,
+                        created_at=now,
+                        updated_at=now
+                    )
+                )
+
+    # Only cache once the write has been committed
+    _cache_state((user_id, conversation_id), payload, now)
 
 
 def load_state(user_id: str, conversation_id: str) -> Optional[Dict[str, Any]]:
-    """Load conversation state from database"""
+    """Load conversation state, reusing the cached payload if the row is unchanged"""
+    key = (user_id, conversation_id)
+    _wait_for_pending_write(key)
+    with _STATE_CACHE_LOCK:
+        cached = _STATE_CACHE.get(key)
+
+    payload_col = SessionState.state_json
+    if cached:
+        # Skip sending the payload back when our cached copy is still current
+        payload_col = case((SessionState.updated_at == cached[1], None), else_=SessionState.state_json)
+
     with db_session() as s:
-        row = (
-            s.query(SessionState)
-            .filter(
+        row = s.execute(
+            select(SessionState.updated_at, payload_col).where(
                 SessionState.user_id == user_id,
                 SessionState.conversation_id == conversation_id
             )
-            .one_or_none()
-        )
-        if row:
-            try:
-                return json.loads(row.state_json)
-            except Exception as e:
-                log_error("Failed to parse session state", e, user_id=user_id)
-                return None
+        ).one_or_none()
+
+    if row is None:
+        with _STATE_CACHE_LOCK:
+            _STATE_CACHE.pop(key, None)
         return None
 
+    version, payload = row
+    if payload is None:
+        payload = cached[0]
+
+    # save_state is the only writer, so the only expected failure is a
+    # corrupt or hand-edited row; anything else is a real bug and should raise
+    try:
+        state = decode_state(payload)
+    except json.JSONDecodeError as e:
+        log_error("Failed to parse session state", e, user_id=user_id)
+        return None
+
+    _cache_state(key, payload, version)
+    return state
+
 
 # ==========================================
 # Unified Intent Handlers
@@ -530,10 +772,11 @@ class UnifiedVoiceHandler:
         upcoming_only = False
 
         if upcoming_text:
-            upcoming_only = str(upcoming_text).lower() in ['yes', 'true', '1', 'upcoming']
+            upcoming_only = str(upcoming_text).lower() in _UPCOMING_TRUE
 
         # Check if "upcoming" is in the title itself
-        if media_title and re.search(r"\bupcoming\b", media_title, re.IGNORECASE):
+        # Cheap substring check first; the regex only confirms word boundaries
+        if media_title and 'upcoming' in media_title.lower() and _UPCOMING_RE.search(media_title):
             upcoming_only = True
 
         # Use temporal filter from enhanced search if available
@@ -549,9 +792,9 @@ class UnifiedVoiceHandler:
             year_filter = parse_year_filter(year)
             if not year_filter:
                 # Fallback to old single year extraction
-                m = re.search(r"(\d{4})", str(year))
-                if m:
-                    year_filter = (int(m.group(1)), int(m.group(1)))
+                single_year = _extract_year(str(year))
+                if single_year is not None:
+                    year_filter = (single_year, single_year)
 
         # Also check the full query text for year expressions if not found in slots
         if not year_filter and media_title:
@@ -560,7 +803,7 @@ class UnifiedVoiceHandler:
         # Extract season number
         season_number = None
         if season_text:
-            m = re.search(r"(\d+)", str(season_text))
+            m = _DIGITS_RE.search(str(season_text))
             if m:
                 season_number = int(m.group(1))
 
@@ -612,24 +855,24 @@ class UnifiedVoiceHandler:
                     'year': None,  # Clear year filter since we're offering non-filtered results
                     'upcoming_only': upcoming_only,
                     'season': season_number,
-                    'results': ranked_without_year,
+                    'results': slim_results(ranked_without_year),
                     'index': 0,
                     'user_term': user_term,
                     'pending_year_filter_question': True,  # Flag to know user needs to confirm
                 }
-                save_state(request.user_id, request.session_id, state)
+                save_state_async(request.user_id, request.session_id, state)
 
                 return VoiceResponse(
                     speech=speech,
                     reprompt="Would you like to hear results from other years?",
                     card_title="Overtalkerr",
-                    card_text=speech
+                    card_text=speech,
+                    state=state
                 )
 
         if not ranked:
             # Check if we had results before fuzzy filtering - suggest the closest match
             if original_results_count > 0 and 'results_before_fuzzy' in locals():
-                from rapidfuzz import fuzz
                 # Find the best match from original results
                 best_match = None
                 best_score = 0
@@ -652,18 +895,19 @@ class UnifiedVoiceHandler:
                         'year': year_filter,
                         'upcoming_only': upcoming_only,
                         'season': season_number,
-                        'results': [best_match],  # Just this one result
+                        'results': slim_results([best_match]),  # Just this one result
                         'index': 0,
                         'user_term': user_term,
                         'pending_did_you_mean_question': True,  # Flag for confirmation
                     }
-                    save_state(request.user_id, request.session_id, state)
+                    save_state_async(request.user_id, request.session_id, state)
 
                     return VoiceResponse(
                         speech=speech,
                         reprompt=f"Did you mean '{suggested_title}'?",
                         card_title="Overtalkerr",
-                        card_text=speech
+                        card_text=speech,
+                        state=state
                     )
 
             speech = f"I couldn't find any matches for '{media_title}'. Try rephrasing or being more specific."
@@ -689,19 +933,20 @@ class UnifiedVoiceHandler:
                     'year': year_filter,
                     'upcoming_only': upcoming_only,
                     'season': season_number,
-                    'results': ranked,
+                    'results': slim_results(ranked),
                     'index': 0,
                     'user_term': user_term,
                     'pending_media_type_clarification': True,
                     'clarification_type': 'movie',  # We're asking if it's a movie
                 }
-                save_state(request.user_id, request.session_id, state)
+                save_state_async(request.user_id, request.session_id, state)
 
                 return VoiceResponse(
                     speech=speech,
                     reprompt=f"Is it a movie or TV show?",
                     card_title="Overtalkerr",
-                    card_text=speech
+                    card_text=speech,
+                    state=state
                 )
 
         # Save state
@@ -718,20 +963,22 @@ class UnifiedVoiceHandler:
             'year': year_filter,
             'upcoming_only': upcoming_only,
             'season': season_number,
-            'results': ranked,
+            'results': slim_results(ranked),
             'index': 0,
             'user_term': user_term,  # Store user's preferred terminology
         }
-        save_state(request.user_id, request.session_id, state)
+        save_state_async(request.user_id, request.session_id, state)
 
         # Build response
         speech = build_speech_for_item(first, "I found", user_term=user_term)
+        prefetch_upcoming_details(ranked, 1)
 
         return VoiceResponse(
             speech=speech,
             reprompt="Is that the one you want?",
             card_title="Overtalkerr",
-            card_text=speech
+            card_text=speech,
+            state=state
         )
 
     def handle_yes(self, request: VoiceRequest) -> VoiceResponse:
@@ -779,11 +1026,12 @@ class UnifiedVoiceHandler:
                     speech=speech,
                     reprompt="Is that the one you want?",
                     card_title="Overtalkerr",
-                    card_text=speech
+                    card_text=speech,
+                    state=state
                 )
             else:
                 speech = "I don't have any results of that type. Try a new search."
-                return VoiceResponse(speech=speech, should_end_session=True)
+                return VoiceResponse(speech=speech, should_end_session=True, state=state)
 
         # Check if user is confirming they want to hear results from other years
         if state.get('pending_year_filter_question'):
@@ -801,11 +1049,12 @@ class UnifiedVoiceHandler:
                     speech=speech,
                     reprompt="Is that the one you want?",
                     card_title="Overtalkerr",
-                    card_text=speech
+                    card_text=speech,
+                    state=state
                 )
             else:
                 speech = "I don't have any results to show. Try a new search."
-                return VoiceResponse(speech=speech, should_end_session=True)
+                return VoiceResponse(speech=speech, should_end_session=True, state=state)
 
         # Check if user wants to start a new search after running out of results
         if state.get('pending_new_search_question'):
@@ -816,7 +1065,8 @@ class UnifiedVoiceHandler:
             return VoiceResponse(
                 speech=speech,
                 reprompt="What would you like to download?",
-                should_end_session=False
+                should_end_session=False,
+                state=state
             )
 
         # Check if user is confirming the "did you mean" suggestion
@@ -835,45 +1085,46 @@ class UnifiedVoiceHandler:
                     speech=speech,
                     reprompt="Is that the one you want?",
                     card_title="Overtalkerr",
-                    card_text=speech
+                    card_text=speech,
+                    state=state
                 )
             else:
                 speech = "I don't have that result anymore. Start a new search."
-                return VoiceResponse(speech=speech, should_end_session=True)
+                return VoiceResponse(speech=speech, should_end_session=True, state=state)
 
         idx = state.get('index', 0)
         results = state.get('results', [])
 
         if idx >= len(results):
             speech = "I've run out of alternatives. Try starting a new search."
-            return VoiceResponse(speech=speech, should_end_session=True)
+            return VoiceResponse(speech=speech, should_end_session=True, state=state)
 
         chosen = results[idx]
-        media_id = chosen.get('id') or chosen.get('mediaId') or chosen.get('tmdbId')
+        media_id = chosen.get('id')  # Resolved from id/mediaId/tmdbId by slim_results()
         media_type = chosen.get('_mediaType') or state.get('media_type') or 'movie'
         season_number = state.get('season')
         title = chosen.get('_title', 'the media')
 
         if not media_id:
             speech = "I got a result but can't request it at the moment. Try searching for a different title."
-            return VoiceResponse(speech=speech, should_end_session=True)
+            return VoiceResponse(speech=speech, should_end_session=True, state=state)
 
         # CONSISTENT LOGIC: "Yes" always means "that's the one I want"
         # Check if media is already available
         if chosen.get('_isAvailable'):
             media_type_word = "movie" if media_type == "movie" else "show"
             speech = f"In that case, enjoy the {media_type_word}!"
-            return VoiceResponse(speech=speech, should_end_session=True)
+            return VoiceResponse(speech=speech, should_end_session=True, state=state)
 
         # Check if media is being processed
         if chosen.get('_isProcessing'):
             speech = f"Perfect! {title} should be available for you to watch soon!"
-            return VoiceResponse(speech=speech, should_end_session=True)
+            return VoiceResponse(speech=speech, should_end_session=True, state=state)
 
         # Check if media is pending approval
         if chosen.get('_isPending'):
             speech = f"{title} has already been requested and is waiting for approval."
-            return VoiceResponse(speech=speech, should_end_session=True)
+            return VoiceResponse(speech=speech, should_end_session=True, state=state)
 
         # Check if partially available (might want to request missing parts)
         if chosen.get('_isPartiallyAvailable'):
@@ -883,7 +1134,7 @@ class UnifiedVoiceHandler:
             else:
                 # Partially available without specific season request - just tell them to enjoy it
                 speech = f"Perfect! Enjoy watching {title}!"
-                return VoiceResponse(speech=speech, should_end_session=True)
+                return VoiceResponse(speech=speech, should_end_session=True, state=state)
 
         # Create request in backend
         try:
@@ -903,17 +1154,18 @@ class UnifiedVoiceHandler:
 
         except OverseerrConnectionError:
             speech = "I can't reach the media app right now. Your request wasn't submitted. Check your connection and try again."
-            return VoiceResponse(speech=speech, should_end_session=True)
+            return VoiceResponse(speech=speech, should_end_session=True, state=state)
         except OverseerrError as e:
             log_error("Failed to create Overseerr request", e, user_id=request.user_id, media_id=media_id)
             speech = "I couldn't create that request. The app might be busy or down. Try again in a moment."
-            return VoiceResponse(speech=speech, should_end_session=True)
+            return VoiceResponse(speech=speech, should_end_session=True, state=state)
 
         return VoiceResponse(
             speech=speech,
             card_title="Request Created",
             card_text=speech,
-            should_end_session=True
+            should_end_session=True,
+            state=state
         )
 
     def handle_no(self, request: VoiceRequest) -> VoiceResponse:
@@ -969,26 +1221,27 @@ class UnifiedVoiceHandler:
                     speech=speech,
                     reprompt="Is that the one you want?",
                     card_title="Overtalkerr",
-                    card_text=speech
+                    card_text=speech,
+                    state=state
                 )
             else:
                 speech = "I don't have any results of that type. Try a new search."
-                return VoiceResponse(speech=speech, should_end_session=True)
+                return VoiceResponse(speech=speech, should_end_session=True, state=state)
 
         # Check if user doesn't want to start a new search after running out of results
         if state.get('pending_new_search_question'):
             speech = f"{get_varied_ok()}. Goodbye!"
-            return VoiceResponse(speech=speech, should_end_session=True)
+            return VoiceResponse(speech=speech, should_end_session=True, state=state)
 
         # Check if user is declining to hear results from other years
         if state.get('pending_year_filter_question'):
             speech = f"{get_varied_ok()}. Try searching again with a different year or without the year."
-            return VoiceResponse(speech=speech, should_end_session=True)
+            return VoiceResponse(speech=speech, should_end_session=True, state=state)
 
         # Check if user is declining the "did you mean" suggestion
         if state.get('pending_did_you_mean_question'):
             speech = f"{get_varied_ok()}. Try searching again with a different title."
-            return VoiceResponse(speech=speech, should_end_session=True)
+            return VoiceResponse(speech=speech, should_end_session=True, state=state)
 
         # CONSISTENT LOGIC: "No" always means "show me the next one"
         idx = state.get('index', 0)
@@ -1008,7 +1261,8 @@ class UnifiedVoiceHandler:
             return VoiceResponse(
                 speech=speech,
                 reprompt="Would you like to search for something else?",
-                should_end_session=False  # Keep session open for yes/no
+                should_end_session=False,  # Keep session open for yes/no
+                state=state
             )
 
         # Update state
@@ -1019,12 +1273,14 @@ class UnifiedVoiceHandler:
         # Build response with varied phrasing based on attempt number
         user_term = state.get('user_term')
         speech = build_speech_for_next(next_item, user_term=user_term, attempt=idx)
+        prefetch_upcoming_details(results, idx + 1)
 
         return VoiceResponse(
             speech=speech,
             reprompt="Is that the one?",
             card_title="Overtalkerr",
-            card_text=speech
+            card_text=speech,
+            state=state
         )
 
     def handle_help(self, request: VoiceRequest) -> VoiceResponse:
@@ -113,7 +113,11 @@ if docker-compose ps | grep -q "Up"; then
     echo ""
     echo "Step 5: Running database migrations..."
     echo "───────────────────────────────────────"
-    docker-compose exec -T overtalkerr python -c "from db import init_db; init_db()" 2>/dev/null || echo "ℹ️  No migrations needed"
+    # (the container also runs them on start; this reports the result)
+    if ! docker-compose exec -T overtalkerr python migrate_db.py; then
+        echo "❌ Database migration failed - check the output above"
+        exit 1
+    fi
     echo "✓ Database up to date"
 
     echo ""
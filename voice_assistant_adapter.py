@@ -45,11 +45,16 @@ class VoiceResponse:
     should_end_session: bool = False
     card_title: Optional[str] = None
     card_text: Optional[str] = None
+    # Conversation state as persisted after this turn (None if the turn had none)
+    state: Optional[Dict[str, Any]] = None
 
 
 class VoiceAssistantAdapter(ABC):
     """Base class for voice assistant adapters"""
 
+    # Platform this adapter handles (set by each subclass)
+    platform: VoiceAssistantPlatform = VoiceAssistantPlatform.UNKNOWN
+
     @abstractmethod
     def detect_platform(self, request_data: Dict[str, Any]) -> bool:
         """Detect if this adapter can handle the request"""
@@ -69,6 +74,8 @@ class VoiceAssistantAdapter(ABC):
 class AlexaAdapter(VoiceAssistantAdapter):
     """Adapter for Amazon Alexa requests"""
 
+    platform = VoiceAssistantPlatform.ALEXA
+
     def detect_platform(self, request_data: Dict[str, Any]) -> bool:
         """Detect Alexa request by checking for version and session"""
         return (
@@ -145,6 +152,8 @@ class AlexaAdapter(VoiceAssistantAdapter):
 class SiriShortcutsAdapter(VoiceAssistantAdapter):
     """Adapter for Siri Shortcuts (webhook-based)"""
 
+    platform = VoiceAssistantPlatform.SIRI
+
     def detect_platform(self, request_data: Dict[str, Any]) -> bool:
         """Detect Siri Shortcuts request by custom header or structure"""
         return request_data.get('platform') == 'siri' or request_data.get('shortcut') is not None
@@ -203,6 +212,8 @@ class SiriShortcutsAdapter(VoiceAssistantAdapter):
 class HomeAssistantAdapter(VoiceAssistantAdapter):
     """Adapter for Home Assistant Assist (webhook-based conversation agent)"""
 
+    platform = VoiceAssistantPlatform.HOME_ASSISTANT
+
     def detect_platform(self, request_data: Dict[str, Any]) -> bool:
         """
         Detect Home Assistant request by checking for webhook-conversation structure.
@@ -383,21 +394,18 @@ class VoiceAssistantRouter:
             SiriShortcutsAdapter(),
             HomeAssistantAdapter()
         ]
+        self._by_platform = {adapter.platform: adapter for adapter in self.adapters}
+
+    def adapter_for(self, platform: VoiceAssistantPlatform) -> Optional[VoiceAssistantAdapter]:
+        """Adapter for a known platform, skipping detection"""
+        return self._by_platform.get(platform)
 
     def detect_platform(self, request_data: Dict[str, Any]) -> Tuple[VoiceAssistantPlatform, Optional[VoiceAssistantAdapter]]:
         """Detect which platform sent the request"""
         for adapter in self.adapters:
             if adapter.detect_platform(request_data):
-                platform = None
-                if isinstance(adapter, AlexaAdapter):
-                    platform = VoiceAssistantPlatform.ALEXA
-                elif isinstance(adapter, SiriShortcutsAdapter):
-                    platform = VoiceAssistantPlatform.SIRI
-                elif isinstance(adapter, HomeAssistantAdapter):
-                    platform = VoiceAssistantPlatform.HOME_ASSISTANT
-
-                logger.info(f"Detected platform: {platform.value if platform else 'unknown'}")
-                return platform, adapter
+                logger.info(f"Detected platform: {adapter.platform.value}")
+                return adapter.platform, adapter
 
         logger.warning("Could not detect voice assistant platform")
         return VoiceAssistantPlatform.UNKNOWN, None
@@ -418,13 +426,9 @@ class VoiceAssistantRouter:
 
     def build_response(self, voice_response: VoiceResponse, platform: VoiceAssistantPlatform) -> Dict[str, Any]:
         """Build response for specific platform"""
-        for adapter in self.adapters:
-            if isinstance(adapter, AlexaAdapter) and platform == VoiceAssistantPlatform.ALEXA:
-                return adapter.build_response(voice_response)
-            elif isinstance(adapter, SiriShortcutsAdapter) and platform == VoiceAssistantPlatform.SIRI:
-                return adapter.build_response(voice_response)
-            elif isinstance(adapter, HomeAssistantAdapter) and platform == VoiceAssistantPlatform.HOME_ASSISTANT:
-                return adapter.build_response(voice_response)
+        adapter = self._by_platform.get(platform)
+        if adapter is not None:
+            return adapter.build_response(voice_response)
 
         # Fallback to basic response
         return {'speech': voice_response.speech}